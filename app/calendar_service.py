@@ -1,15 +1,26 @@
 import asyncio
 import calendar as cal
+import functools
+import json
 import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date as dt_date
 from datetime import datetime, timedelta
+from datetime import time as dt_time
 from pathlib import Path
 
 from google.auth.exceptions import RefreshError
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import Flow
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
 
 from app.config import (
     GOOGLE_CLIENT_ID,
@@ -24,9 +35,59 @@ from app.config import (
 
 logger = logging.getLogger(__name__)
 
+_BATCH_LIMIT = 50  # max calls per Google API batch request
+_BATCH_CONCURRENCY = 4  # batch requests in flight at once per range delete
+_DELETE_CONCURRENCY = 10  # parallel single deletes when batching fails
+_DELETE_RETRIES = 3  # backoff retries per single delete on 429/5xx
+
+_DAY_START = dt_time(0, 0)
+_DAY_END = dt_time(23, 59, 59)
+
 
 # ── Token & Auth Helpers ──────────────────────────────────────────
 
+# Blocking Google API work gets its own pool so a burst of calendar calls
+# cannot starve other users of the loop's default executor, and vice versa.
+_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="gcal")
+_thread_local = threading.local()
+
+
+async def _run_blocking(func, *args):
+    """Run a blocking Google API call on the dedicated calendar pool."""
+    return await asyncio.get_running_loop().run_in_executor(_executor, func, *args)
+
+
+def _authorized_http(creds: Credentials) -> AuthorizedHttp:
+    """Wrap creds around the calling thread's keep-alive httplib2 connection.
+
+    httplib2.Http is not thread-safe, so each worker thread keeps its own and
+    reuses the TLS connection to googleapis.com across calls.
+    """
+    http = getattr(_thread_local, "http", None)
+    if http is None:
+        http = _thread_local.http = build_http()
+    return AuthorizedHttp(creds, http=http)
+
+
+def _refresh_request() -> Request:
+    """Return the calling thread's token-refresh transport (keeps its session alive)."""
+    request = getattr(_thread_local, "refresh_request", None)
+    if request is None:
+        request = _thread_local.refresh_request = Request()
+    return request
+
+
+@functools.cache
+def _discovery_doc() -> dict:
+    """Parse the Calendar v3 discovery document bundled with googleapiclient once."""
+    return json.loads(get_static_doc("calendar", "v3"))
+
+
+def _calendar_service(creds: Credentials):
+    """Build a Calendar API client bound to the calling thread's connection."""
+    return build_from_document(_discovery_doc(), http=_authorized_http(creds))
+
+
 def _token_path(chat_id: int) -> Path:
     return TOKENS_DIR / f"{chat_id}.json"
 
@@ -58,24 +119,32 @@ def get_auth_url(chat_id: int) -> str:
     return auth_url
 
 
+# chat_id -> Credentials, so valid tokens are served without a disk read
+_creds_cache: dict[int, Credentials] = {}
+
+
 def _load_credentials(chat_id: int) -> Credentials | None:
     path = _token_path(chat_id)
-    if not path.exists():
-        return None
-
-    creds = Credentials.from_authorized_user_file(str(path), GOOGLE_SCOPES)
+    creds = _creds_cache.get(chat_id)
+    if creds is None:
+        if not path.exists():
+            return None
+        creds = Credentials.from_authorized_user_file(str(path), GOOGLE_SCOPES)
+        _creds_cache[chat_id] = creds
 
     if not creds.valid:
         if creds.expired and creds.refresh_token:
             try:
-                creds.refresh(Request())
+                creds.refresh(_refresh_request())
                 _save_credentials(chat_id, creds)
             except RefreshError:
                 logger.warning("Token refresh failed for chat_id=%s, deleting token", chat_id)
+                _creds_cache.pop(chat_id, None)
                 path.unlink(missing_ok=True)
                 return None
         else:
             logger.warning("No refresh token for chat_id=%s, deleting token", chat_id)
+            _creds_cache.pop(chat_id, None)
             path.unlink(missing_ok=True)
             return None
 
@@ -84,34 +153,118 @@ def _load_credentials(chat_id: int) -> Credentials | None:
 
 def _save_credentials(chat_id: int, creds: Credentials) -> None:
     path = _token_path(chat_id)
-    path.write_text(creds.to_json())
+    # Write-then-rename so a crash or concurrent refresh never leaves a torn file
+    tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+    tmp_path.write_text(creds.to_json())
+    os.replace(tmp_path, path)
+    _creds_cache[chat_id] = creds
 
 
 def is_authenticated(chat_id: int) -> bool:
+    # Cached credentials are dropped whenever their token file is deleted
+    if chat_id in _creds_cache:
+        return True
     return _token_path(chat_id).exists()
 
 
+# (TOKENS_DIR mtime_ns, chat_ids); the directory mtime changes on any add/remove
+_chat_ids_cache: tuple[int, list[int]] | None = None
+
+
 def get_all_authenticated_chat_ids() -> list[int]:
-    return [
+    global _chat_ids_cache
+    mtime = TOKENS_DIR.stat().st_mtime_ns
+    if _chat_ids_cache is not None and _chat_ids_cache[0] == mtime:
+        return list(_chat_ids_cache[1])
+
+    chat_ids = sorted(
         int(p.stem)
         for p in TOKENS_DIR.glob("*.json")
         if p.stem.isdigit()
-    ]
+    )
+    _chat_ids_cache = (mtime, chat_ids)
+    return list(chat_ids)
+
+
+# Chat whose token last worked for shared-calendar queries; tried first
+_last_good_chat_id: int | None = None
 
 
 def _get_any_valid_creds() -> Credentials | None:
+    global _last_good_chat_id
+    if _last_good_chat_id is not None:
+        creds = _load_credentials(_last_good_chat_id)
+        if creds is not None:
+            return creds
+        _last_good_chat_id = None
+
     for cid in get_all_authenticated_chat_ids():
         creds = _load_credentials(cid)
         if creds is not None:
+            _last_good_chat_id = cid
             return creds
     return None
 
 
+async def _get_credentials(chat_id: int) -> Credentials | None:
+    """Return valid credentials, skipping the worker-thread hop on a cache hit."""
+    creds = _creds_cache.get(chat_id)
+    if creds is not None and creds.valid:
+        return creds
+    return await _run_blocking(_load_credentials, chat_id)
+
+
+async def _get_shared_credentials() -> Credentials | None:
+    """Async counterpart of _get_any_valid_creds with the same cache fast path."""
+    if _last_good_chat_id is not None:
+        creds = _creds_cache.get(_last_good_chat_id)
+        if creds is not None and creds.valid:
+            return creds
+    return await _run_blocking(_get_any_valid_creds)
+
+
+# ── Event List Cache ──────────────────────────────────────────────
+
+# The calendar is shared, so listings are keyed by range only, not by user.
+# Entries are short-lived and cleared after every mutation made through the bot.
+_LIST_CACHE_TTL = 30  # seconds
+_list_cache: dict[tuple, tuple[float, list[dict]]] = {}
+# Bumped on every invalidation. Listings are fetched on worker threads, so a
+# fetch that started before a mutation may finish after it; callers capture
+# the generation before fetching and the put is dropped if it has moved on.
+_list_generation = 0
+_list_cache_lock = threading.Lock()
+
+
+def _list_cache_get(key: tuple) -> list[dict] | None:
+    entry = _list_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, events = entry
+    if time.monotonic() - stored_at > _LIST_CACHE_TTL:
+        _list_cache.pop(key, None)
+        return None
+    return events
+
+
+def _list_cache_put(key: tuple, events: list[dict], generation: int) -> None:
+    with _list_cache_lock:
+        if generation == _list_generation:
+            _list_cache[key] = (time.monotonic(), events)
+
+
+def _invalidate_list_cache() -> None:
+    global _list_generation
+    with _list_cache_lock:
+        _list_generation += 1
+        _list_cache.clear()
+
+
 # ── Authentication ────────────────────────────────────────────────
 
 def _check_calendar_access_sync(creds: Credentials) -> tuple[bool, str]:
     try:
-        service = build("calendar", "v3", credentials=creds)
+        service = _calendar_service(creds)
         calendar = service.calendars().get(calendarId=SHARED_CALENDAR_ID).execute()
         calendar_name = calendar.get("summary", SHARED_CALENDAR_ID)
         return True, calendar_name
@@ -140,11 +293,11 @@ def _authenticate_user_sync(auth_code: str) -> tuple[Credentials | None, str]:
 
 
 async def authenticate_user(chat_id: int, auth_code: str) -> tuple[bool, str]:
-    creds, error = await asyncio.to_thread(_authenticate_user_sync, auth_code)
+    creds, error = await _run_blocking(_authenticate_user_sync, auth_code)
     if creds is None:
         return False, error
 
-    has_access, message = await asyncio.to_thread(_check_calendar_access_sync, creds)
+    has_access, message = await _run_blocking(_check_calendar_access_sync, creds)
     if not has_access:
         return False, message
 
@@ -163,14 +316,14 @@ async def add_event(
     location: str | None = None,
     description: str | None = None,
 ) -> tuple[bool, str]:
-    creds = await asyncio.to_thread(_load_credentials, chat_id)
+    creds = await _get_credentials(chat_id)
     if creds is None:
         return False, "인증이 만료되었습니다. /start로 다시 인증해주세요."
 
     def _insert():
-        start_dt = datetime.strptime(f"{date} {start_time}", "%Y-%m-%d %H:%M")
+        start_dt = _parse_local(date, start_time)
         if end_time:
-            end_dt = datetime.strptime(f"{date} {end_time}", "%Y-%m-%d %H:%M")
+            end_dt = _parse_local(date, end_time)
         else:
             end_dt = start_dt + timedelta(hours=1)
 
@@ -184,14 +337,14 @@ async def add_event(
         if description:
             event_body["description"] = description
 
-        service = build("calendar", "v3", credentials=creds)
+        service = _calendar_service(creds)
         event = service.events().insert(
             calendarId=SHARED_CALENDAR_ID, body=event_body
         ).execute()
         return event.get("htmlLink", "")
 
     try:
-        link = await asyncio.to_thread(_insert)
+        link = await _run_blocking(_insert)
         return True, link
     except HttpError as e:
         if e.resp.status == 403:
@@ -200,6 +353,8 @@ async def add_event(
     except Exception:
         logger.exception("Unexpected error in add_event")
         return False, "알 수 없는 오류가 발생했습니다."
+    finally:
+        _invalidate_list_cache()
 
 
 # ── Add Events by Range ──────────────────────────────────────────
@@ -215,22 +370,22 @@ async def add_events_by_range(
     description: str | None = None,
 ) -> tuple[int, str]:
     """Add an event on each day from date_from to date_to. Returns (count, error)."""
-    creds = await asyncio.to_thread(_load_credentials, chat_id)
+    creds = await _get_credentials(chat_id)
     if creds is None:
         return 0, "인증이 만료되었습니다. /start로 다시 인증해주세요."
 
     def _insert_range():
         start_date = _safe_parse_date(date_from)
         end_date = _safe_parse_date(date_to)
-        service = build("calendar", "v3", credentials=creds)
+        service = _calendar_service(creds)
 
         created = 0
         current = start_date
         while current <= end_date:
             date_str = current.strftime("%Y-%m-%d")
-            start_dt = datetime.strptime(f"{date_str} {start_time}", "%Y-%m-%d %H:%M")
+            start_dt = _parse_local(date_str, start_time)
             if end_time:
-                end_dt = datetime.strptime(f"{date_str} {end_time}", "%Y-%m-%d %H:%M")
+                end_dt = _parse_local(date_str, end_time)
             else:
                 end_dt = start_dt + timedelta(hours=1)
 
@@ -253,7 +408,7 @@ async def add_events_by_range(
         return created, ""
 
     try:
-        count, error = await asyncio.to_thread(_insert_range)
+        count, error = await _run_blocking(_insert_range)
         return count, error
     except HttpError as e:
         if e.resp.status == 403:
@@ -262,6 +417,8 @@ async def add_events_by_range(
     except Exception:
         logger.exception("Unexpected error in add_events_by_range")
         return 0, "알 수 없는 오류가 발생했습니다."
+    finally:
+        _invalidate_list_cache()
 
 
 # ── Add Multi-day Event ──────────────────────────────────────────
@@ -275,7 +432,7 @@ async def add_multiday_event(
     description: str | None = None,
 ) -> tuple[bool, str]:
     """Create a single all-day event spanning date_from to date_to."""
-    creds = await asyncio.to_thread(_load_credentials, chat_id)
+    creds = await _get_credentials(chat_id)
     if creds is None:
         return False, "인증이 만료되었습니다. /start로 다시 인증해주세요."
 
@@ -294,14 +451,14 @@ async def add_multiday_event(
         if description:
             event_body["description"] = description
 
-        service = build("calendar", "v3", credentials=creds)
+        service = _calendar_service(creds)
         event = service.events().insert(
             calendarId=SHARED_CALENDAR_ID, body=event_body
         ).execute()
         return event.get("htmlLink", "")
 
     try:
-        link = await asyncio.to_thread(_insert)
+        link = await _run_blocking(_insert)
         return True, link
     except HttpError as e:
         if e.resp.status == 403:
@@ -310,6 +467,8 @@ async def add_multiday_event(
     except Exception:
         logger.exception("Unexpected error in add_multiday_event")
         return False, "알 수 없는 오류가 발생했습니다."
+    finally:
+        _invalidate_list_cache()
 
 
 # ── Delete Event ──────────────────────────────────────────────────
@@ -320,7 +479,7 @@ async def delete_event(
     date: str,
     original_time: str | None = None,
 ) -> tuple[bool, str]:
-    creds = await asyncio.to_thread(_load_credentials, chat_id)
+    creds = await _get_credentials(chat_id)
     if creds is None:
         return False, "인증이 만료되었습니다. /start로 다시 인증해주세요."
 
@@ -330,14 +489,14 @@ async def delete_event(
         if not matched:
             return None, "해당 날짜에 일치하는 일정을 찾을 수 없습니다."
 
-        service = build("calendar", "v3", credentials=creds)
+        service = _calendar_service(creds)
         service.events().delete(
             calendarId=SHARED_CALENDAR_ID, eventId=matched["id"]
         ).execute()
         return matched.get("summary", title), None
 
     try:
-        deleted_title, error = await asyncio.to_thread(_delete)
+        deleted_title, error = await _run_blocking(_delete)
         if error:
             return False, error
         return True, deleted_title
@@ -348,6 +507,8 @@ async def delete_event(
     except Exception:
         logger.exception("Unexpected error in delete_event")
         return False, "알 수 없는 오류가 발생했습니다."
+    finally:
+        _invalidate_list_cache()
 
 
 # ── Edit Event ────────────────────────────────────────────────────
@@ -359,7 +520,7 @@ async def edit_event(
     changes: dict,
     original_time: str | None = None,
 ) -> tuple[bool, str]:
-    creds = await asyncio.to_thread(_load_credentials, chat_id)
+    creds = await _get_credentials(chat_id)
     if creds is None:
         return False, "인증이 만료되었습니다. /start로 다시 인증해주세요."
 
@@ -368,6 +529,9 @@ async def edit_event(
         matched = _match_event(events, title, original_time)
         if not matched:
             return None, "해당 날짜에 일치하는 일정을 찾을 수 없습니다."
+        # Copy without the _match_event keys: the listing may be shared
+        # through the list cache, and the API must not see them
+        matched = {k: v for k, v in matched.items() if not k.startswith("_")}
 
         # Apply changes
         if changes.get("title"):
@@ -379,9 +543,7 @@ async def edit_event(
         current_end = matched.get("end", {})
 
         if changes.get("start_time"):
-            start_dt = datetime.strptime(
-                f"{new_date} {changes['start_time']}", "%Y-%m-%d %H:%M"
-            )
+            start_dt = _parse_local(new_date, changes["start_time"])
             matched["start"] = {
                 "dateTime": start_dt.isoformat(),
                 "timeZone": TIMEZONE_STR,
@@ -397,27 +559,21 @@ async def edit_event(
             # Date changed but time unchanged — shift the date
             if "dateTime" in current_start:
                 old_time = current_start["dateTime"][11:16]
-                start_dt = datetime.strptime(
-                    f"{new_date} {old_time}", "%Y-%m-%d %H:%M"
-                )
+                start_dt = _parse_local(new_date, old_time)
                 matched["start"] = {
                     "dateTime": start_dt.isoformat(),
                     "timeZone": TIMEZONE_STR,
                 }
             if "dateTime" in current_end:
                 old_time = current_end["dateTime"][11:16]
-                end_dt = datetime.strptime(
-                    f"{new_date} {old_time}", "%Y-%m-%d %H:%M"
-                )
+                end_dt = _parse_local(new_date, old_time)
                 matched["end"] = {
                     "dateTime": end_dt.isoformat(),
                     "timeZone": TIMEZONE_STR,
                 }
 
         if changes.get("end_time"):
-            end_dt = datetime.strptime(
-                f"{new_date} {changes['end_time']}", "%Y-%m-%d %H:%M"
-            )
+            end_dt = _parse_local(new_date, changes["end_time"])
             matched["end"] = {
                 "dateTime": end_dt.isoformat(),
                 "timeZone": TIMEZONE_STR,
@@ -429,7 +585,7 @@ async def edit_event(
         if changes.get("description"):
             matched["description"] = changes["description"]
 
-        service = build("calendar", "v3", credentials=creds)
+        service = _calendar_service(creds)
         updated = service.events().update(
             calendarId=SHARED_CALENDAR_ID,
             eventId=matched["id"],
@@ -438,7 +594,7 @@ async def edit_event(
         return updated.get("summary", title), None
 
     try:
-        updated_title, error = await asyncio.to_thread(_update)
+        updated_title, error = await _run_blocking(_update)
         if error:
             return False, error
         return True, updated_title
@@ -449,55 +605,51 @@ async def edit_event(
     except Exception:
         logger.exception("Unexpected error in edit_event")
         return False, "알 수 없는 오류가 발생했습니다."
+    finally:
+        _invalidate_list_cache()
 
 
 # ── Query Events ──────────────────────────────────────────────────
 
 async def get_today_events() -> list[dict]:
-    creds = await asyncio.to_thread(_get_any_valid_creds)
+    creds = await _get_shared_credentials()
     if creds is None:
         logger.warning("No valid credentials found for get_today_events")
         return []
 
-    def _list():
-        now = datetime.now(TIMEZONE)
-        start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        end_of_day = now.replace(hour=23, minute=59, second=59, microsecond=0)
-
-        service = build("calendar", "v3", credentials=creds)
-        result = service.events().list(
-            calendarId=SHARED_CALENDAR_ID,
-            timeMin=start_of_day.isoformat(),
-            timeMax=end_of_day.isoformat(),
-            singleEvents=True,
-            orderBy="startTime",
-        ).execute()
-        return result.get("items", [])
+    # Same listing as the day lookup behind delete/edit, so both share
+    # one list-cache entry
+    today = datetime.now(TIMEZONE).date().isoformat()
+    cached = _list_cache_get(("day", today))
+    if cached is not None:
+        return cached
 
     try:
-        return await asyncio.to_thread(_list)
+        return await _run_blocking(_find_events_by_date, creds, today)
     except Exception:
         logger.exception("Unexpected error in get_today_events")
         return []
 
 
 async def get_week_events() -> list[dict]:
-    creds = await asyncio.to_thread(_get_any_valid_creds)
+    creds = await _get_shared_credentials()
     if creds is None:
         logger.warning("No valid credentials found for get_week_events")
         return []
 
+    today = datetime.now(TIMEZONE).date()
+    monday = today - timedelta(days=today.weekday())
+    cache_key = ("week", monday)
+    cached = _list_cache_get(cache_key)
+    if cached is not None:
+        return cached
+    generation = _list_generation
+
     def _list():
-        now = datetime.now(TIMEZONE)
-        # Monday of this week
-        start_of_week = (now - timedelta(days=now.weekday())).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-        end_of_week = (start_of_week + timedelta(days=6)).replace(
-            hour=23, minute=59, second=59, microsecond=0
-        )
+        start_of_week, _ = _day_bounds(monday)
+        _, end_of_week = _day_bounds(monday + timedelta(days=6))
 
-        service = build("calendar", "v3", credentials=creds)
+        service = _calendar_service(creds)
         result = service.events().list(
             calendarId=SHARED_CALENDAR_ID,
             timeMin=start_of_week.isoformat(),
@@ -505,10 +657,12 @@ async def get_week_events() -> list[dict]:
             singleEvents=True,
             orderBy="startTime",
         ).execute()
-        return result.get("items", [])
+        events = result.get("items", [])
+        _list_cache_put(cache_key, events, generation)
+        return events
 
     try:
-        return await asyncio.to_thread(_list)
+        return await _run_blocking(_list)
     except Exception:
         logger.exception("Unexpected error in get_week_events")
         return []
@@ -519,42 +673,57 @@ async def search_events(
     keyword: str | None = None,
     date_from: str | None = None,
     date_to: str | None = None,
+    max_results: int | None = None,
 ) -> list[dict]:
-    creds = await asyncio.to_thread(_load_credentials, chat_id)
+    creds = await _get_credentials(chat_id)
     if creds is None:
         return []
 
-    def _search():
-        now = datetime.now(TIMEZONE)
-
+    try:
         if date_from:
-            time_min = _safe_parse_date(date_from).replace(tzinfo=TIMEZONE)
+            time_min, _ = _day_bounds(_safe_parse_date(date_from))
         else:
-            time_min = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            time_min, _ = _day_bounds(datetime.now(TIMEZONE))
 
         if date_to:
-            time_max = _safe_parse_date(date_to).replace(
-                hour=23, minute=59, second=59, tzinfo=TIMEZONE
-            )
+            _, time_max = _day_bounds(_safe_parse_date(date_to))
         else:
             time_max = time_min + timedelta(days=30)
+    except (ValueError, IndexError):
+        logger.exception("Invalid date range in search_events")
+        return []
 
-        service = build("calendar", "v3", credentials=creds)
+    # The keyword isn't sent to the API, so the listing depends on the
+    # range alone (e.g. month summaries after mutations, repeat searches)
+    cache_key = ("range", time_min, time_max, max_results)
+    cached = _list_cache_get(cache_key)
+    if cached is not None:
+        return cached
+    generation = _list_generation
+
+    def _search():
+        service = _calendar_service(creds)
         params = {
             "calendarId": SHARED_CALENDAR_ID,
             "timeMin": time_min.isoformat(),
             "timeMax": time_max.isoformat(),
             "singleEvents": True,
             "orderBy": "startTime",
+            # Only what the formatters and event context read
+            "fields": "items(id,summary,start,end,location,description)",
         }
+        if max_results:
+            params["maxResults"] = max_results
         # Don't use API q param — it does word-level matching and
         # misses substrings like "AX" in "AX서밋".
-        # Fetch all events in range; GPT will filter semantically.
+        # Fetch all events in range; the bot filters by keyword.
         result = service.events().list(**params).execute()
-        return result.get("items", [])
+        events = result.get("items", [])
+        _list_cache_put(cache_key, events, generation)
+        return events
 
     try:
-        return await asyncio.to_thread(_search)
+        return await _run_blocking(_search)
     except Exception:
         logger.exception("Unexpected error in search_events")
         return []
@@ -571,11 +740,37 @@ def _safe_parse_date(date_str: str) -> datetime:
     return datetime(year, month, day)
 
 
-def _find_events_by_date(creds: Credentials, date: str) -> list[dict]:
-    start_of_day = datetime.strptime(date, "%Y-%m-%d").replace(tzinfo=TIMEZONE)
-    end_of_day = start_of_day.replace(hour=23, minute=59, second=59)
+def _day_bounds(day: dt_date) -> tuple[datetime, datetime]:
+    """Return the TIMEZONE-aware first and last second of a day."""
+    return (
+        datetime.combine(day, _DAY_START, TIMEZONE),
+        datetime.combine(day, _DAY_END, TIMEZONE),
+    )
 
-    service = build("calendar", "v3", credentials=creds)
+
+def _parse_local(date: str, hhmm: str) -> datetime:
+    """Parse YYYY-MM-DD and HH:MM into a naive local datetime."""
+    try:
+        return datetime.fromisoformat(f"{date}T{hhmm}")
+    except ValueError:
+        # fromisoformat needs a zero-padded hour; keep accepting "9:00"
+        return datetime.strptime(f"{date} {hhmm}", "%Y-%m-%d %H:%M")
+
+
+def _find_events_by_date(creds: Credentials, date: str) -> list[dict]:
+    # Always list the whole day rather than narrowing with q=title or an
+    # original_time window: q misses Korean substrings (see search_events),
+    # and _match_event needs every event of the day for its time and
+    # single-event fallbacks. The day listing is cached instead.
+    cache_key = ("day", date)
+    cached = _list_cache_get(cache_key)
+    if cached is not None:
+        return cached
+    generation = _list_generation
+
+    start_of_day, end_of_day = _day_bounds(dt_date.fromisoformat(date))
+
+    service = _calendar_service(creds)
     result = service.events().list(
         calendarId=SHARED_CALENDAR_ID,
         timeMin=start_of_day.isoformat(),
@@ -583,7 +778,13 @@ def _find_events_by_date(creds: Credentials, date: str) -> list[dict]:
         singleEvents=True,
         orderBy="startTime",
     ).execute()
-    return result.get("items", [])
+    events = result.get("items", [])
+    # Precompute the keys _match_event compares on, once per listing
+    for event in events:
+        event["_summary_lower"] = event.get("summary", "").lower()
+        event["_start_hhmm"] = event.get("start", {}).get("dateTime", "")[11:16]
+    _list_cache_put(cache_key, events, generation)
+    return events
 
 
 async def delete_events_by_range(
@@ -593,17 +794,15 @@ async def delete_events_by_range(
     keyword: str | None = None,
 ) -> tuple[int, str]:
     """Delete all events in a date range. Returns (count_deleted, error_message)."""
-    creds = await asyncio.to_thread(_load_credentials, chat_id)
+    creds = await _get_credentials(chat_id)
     if creds is None:
         return 0, "인증이 만료되었습니다. /start로 다시 인증해주세요."
 
-    def _bulk_delete():
-        time_min = _safe_parse_date(date_from).replace(tzinfo=TIMEZONE)
-        time_max = _safe_parse_date(date_to).replace(
-            hour=23, minute=59, second=59, tzinfo=TIMEZONE
-        )
+    def _list_ids():
+        time_min, _ = _day_bounds(_safe_parse_date(date_from))
+        _, time_max = _day_bounds(_safe_parse_date(date_to))
 
-        service = build("calendar", "v3", credentials=creds)
+        service = _calendar_service(creds)
         params = {
             "calendarId": SHARED_CALENDAR_ID,
             "timeMin": time_min.isoformat(),
@@ -615,23 +814,39 @@ async def delete_events_by_range(
             params["q"] = keyword
 
         result = service.events().list(**params).execute()
-        events = result.get("items", [])
+        return [event["id"] for event in result.get("items", [])]
 
-        if not events:
+    try:
+        event_ids = await _run_blocking(_list_ids)
+        if not event_ids:
             return 0, "해당 기간에 일정이 없습니다."
 
-        deleted = 0
-        for event in events:
-            service.events().delete(
-                calendarId=SHARED_CALENDAR_ID, eventId=event["id"]
-            ).execute()
-            deleted += 1
-
-        return deleted, ""
-
-    try:
-        count, error = await asyncio.to_thread(_bulk_delete)
-        return count, error
+        # Each batch goes out from its own worker thread and connection; a few
+        # at a time so a large purge doesn't trip the per-user rate limit
+        semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+        async def _send_batch(chunk: list[str]):
+            async with semaphore:
+                return await _run_blocking(_batch_delete, creds, chunk)
+
+        results = await asyncio.gather(*(
+            _send_batch(event_ids[i:i + _BATCH_LIMIT])
+            for i in range(0, len(event_ids), _BATCH_LIMIT)
+        ))
+        count = sum(deleted for deleted, _, _ in results)
+        unsent = [event_id for _, chunk, _ in results for event_id in chunk]
+        failed = [status for _, _, statuses in results for status in statuses]
+        if unsent:
+            fallback_deleted, fallback_failed = await _delete_concurrently(creds, unsent)
+            count += fallback_deleted
+            failed += fallback_failed
+        if count == 0:
+            if failed and all(status == 403 for status in failed):
+                return 0, "캘린더 접근 권한이 없습니다."
+            return 0, "일정을 삭제하지 못했습니다."
+        if failed:
+            return count, f"{len(failed)}개 일정은 삭제하지 못했습니다."
+        return count, ""
     except HttpError as e:
         if e.resp.status == 403:
             return 0, "캘린더 접근 권한이 없습니다."
@@ -639,26 +854,127 @@ async def delete_events_by_range(
     except Exception:
         logger.exception("Unexpected error in delete_events_by_range")
         return 0, "알 수 없는 오류가 발생했습니다."
+    finally:
+        _invalidate_list_cache()
+
+
+def _error_status(exception: Exception) -> int | None:
+    return exception.resp.status if isinstance(exception, HttpError) else None
+
+
+def _is_rate_limited(exception: Exception) -> bool:
+    if not isinstance(exception, HttpError):
+        return False
+    if exception.resp.status == 429:
+        return True
+    return exception.resp.status == 403 and any(
+        reason in exception.content for reason in (b"rateLimitExceeded", b"userRateLimitExceeded")
+    )
+
+
+def _batch_delete(
+    creds: Credentials, event_ids: list[str]
+) -> tuple[int, list[str], list[int | None]]:
+    """Delete up to _BATCH_LIMIT events in one batch HTTP request.
+
+    Returns (count_deleted, unsent_ids, failed_statuses): unsent_ids holds
+    the rate-limited events, or the whole chunk if the batch could not be sent
+    at all, and failed_statuses the HTTP status (None if unknown) of each
+    event that failed otherwise.
+    """
+    deleted = 0
+    failed: list[int | None] = []
+    rate_limited: list[str] = []
+
+    def _on_deleted(request_id, response, exception):
+        nonlocal deleted
+        if exception is None:
+            deleted += 1
+        elif _is_rate_limited(exception):
+            rate_limited.append(request_id)
+        else:
+            logger.warning("Batch delete failed for event_id=%s: %s", request_id, exception)
+            failed.append(_error_status(exception))
+
+    service = _calendar_service(creds)
+    batch = service.new_batch_http_request(callback=_on_deleted)
+    for event_id in event_ids:
+        batch.add(
+            service.events().delete(calendarId=SHARED_CALENDAR_ID, eventId=event_id),
+            request_id=event_id,
+        )
+    try:
+        batch.execute()
+    except Exception:
+        logger.warning("Batch delete request failed for %d events", len(event_ids), exc_info=True)
+        return deleted, event_ids, failed
+
+    return deleted, rate_limited, failed
+
+
+async def _delete_concurrently(
+    creds: Credentials, event_ids: list[str]
+) -> tuple[int, list[int | None]]:
+    """Fallback for _batch_delete: one DELETE per event, run in parallel threads
+    with the client's backoff on rate limits.
+
+    Returns (count_deleted, failed_statuses) like _batch_delete.
+    """
+    service = await _run_blocking(_calendar_service, creds)
+    semaphore = asyncio.Semaphore(_DELETE_CONCURRENCY)
+
+    async def _delete_one(event_id: str) -> None:
+        request = service.events().delete(calendarId=SHARED_CALENDAR_ID, eventId=event_id)
+        async with semaphore:
+            # Resolve the connection inside the worker thread, not on the loop
+            await _run_blocking(
+                lambda: request.execute(http=_authorized_http(creds), num_retries=_DELETE_RETRIES)
+            )
+
+    results = await asyncio.gather(
+        *(_delete_one(event_id) for event_id in event_ids), return_exceptions=True
+    )
+    deleted = 0
+    failed: list[int | None] = []
+    for event_id, result in zip(event_ids, results):
+        if isinstance(result, Exception):
+            logger.warning("Delete failed for event_id=%s: %s", event_id, result)
+            failed.append(_error_status(result))
+        else:
+            deleted += 1
+    return deleted, failed
 
 
 def _match_event(events: list[dict], title: str, start_time: str | None = None) -> dict | None:
-    """Match an event by title, then by start time, then by single-event fallback."""
+    """Match an event by title, then by start time, then by single-event fallback.
+
+    Expects events from _find_events_by_date, which precomputes the
+    _summary_lower and _start_hhmm keys.
+    """
     if not events:
         return None
 
-    # 1. Try title match
+    # Single pass: an exact title wins outright; otherwise remember the
+    # first substring match and index start times for step 2.
     title_lower = title.lower()
+    fuzzy = None
+    by_time: dict[str, dict] = {}
     for event in events:
-        summary = event.get("summary", "").lower()
-        if title_lower in summary or summary in title_lower:
+        summary = event["_summary_lower"]
+        if summary == title_lower:
             return event
+        if fuzzy is None and (title_lower in summary or summary in title_lower):
+            fuzzy = event
+        if event["_start_hhmm"]:
+            by_time.setdefault(event["_start_hhmm"], event)
+
+    # 1. Title substring match
+    if fuzzy is not None:
+        return fuzzy
 
     # 2. Try start time match
-    if start_time:
-        for event in events:
-            event_start = event.get("start", {}).get("dateTime", "")
-            if event_start and event_start[11:16] == start_time:
-                return event
+    if start_time and start_time in by_time:
+        return by_time[start_time]
 
     # 3. If only one event on that day, use it
     if len(events) == 1:
@@ -1,6 +1,9 @@
 """Google Maps geocoding & navigation URL construction."""
 
+import asyncio
 import logging
+import time
+from collections import OrderedDict
 from urllib.parse import quote
 
 import aiohttp
@@ -11,6 +14,35 @@ logger = logging.getLogger(__name__)
 
 _GEOCODE_URL = "https://maps.googleapis.com/maps/api/geocode/json"
 
+_CACHE_MAX = 1024
+_CACHE_TTL = 86400  # seconds; places rarely move, but don't pin them forever
+# Normalized query -> (stored_at, geocode result), least recently used first
+_geocode_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+# Normalized query -> lookup in progress, shared by concurrent callers
+_inflight: dict[str, asyncio.Task] = {}
+
+# Shared across calls so repeat lookups reuse the warm TLS connection
+_session: aiohttp.ClientSession | None = None
+
+
+def _get_session() -> aiohttp.ClientSession:
+    """Return the shared session, creating it on first use inside the running loop."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=90),
+            timeout=aiohttp.ClientTimeout(total=10),
+        )
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared session. Call from post_shutdown."""
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
+
 
 async def geocode(query: str) -> dict | None:
     """Geocode a place name/address to WGS84 coordinates.
@@ -22,6 +54,26 @@ async def geocode(query: str) -> dict | None:
         logger.error("Google Maps API key not configured")
         return None
 
+    cache_key = " ".join(query.lower().split())
+    cached = _geocode_cache.get(cache_key)
+    if cached is not None:
+        stored_at, result = cached
+        if time.monotonic() - stored_at < _CACHE_TTL:
+            _geocode_cache.move_to_end(cache_key)
+            return result
+        del _geocode_cache[cache_key]
+
+    task = _inflight.get(cache_key)
+    if task is None:
+        task = asyncio.create_task(_fetch(query, cache_key))
+        _inflight[cache_key] = task
+        task.add_done_callback(lambda _: _inflight.pop(cache_key, None))
+    # Shielded so one caller giving up doesn't cancel the others' lookup
+    return await asyncio.shield(task)
+
+
+async def _fetch(query: str, cache_key: str) -> dict | None:
+    """Query the Geocoding API, caching a successful result under cache_key."""
     params = {
         "address": query,
         "key": GOOGLE_MAPS_API_KEY,
@@ -29,17 +81,12 @@ async def geocode(query: str) -> dict | None:
     }
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                _GEOCODE_URL,
-                params=params,
-                timeout=aiohttp.ClientTimeout(total=10),
-            ) as resp:
-                if resp.status != 200:
-                    body = await resp.text()
-                    logger.error("Google geocode API returned status %s: %s", resp.status, body)
-                    return None
-                data = await resp.json()
+        async with _get_session().get(_GEOCODE_URL, params=params) as resp:
+            if resp.status != 200:
+                body = await resp.text()
+                logger.error("Google geocode API returned status %s: %s", resp.status, body)
+                return None
+            data = await resp.json()
     except Exception:
         logger.exception("Google geocode request failed")
         return None
@@ -51,11 +98,15 @@ async def geocode(query: str) -> dict | None:
 
     first = results[0]
     location = first["geometry"]["location"]
-    return {
+    result = {
         "lat": location["lat"],
         "lng": location["lng"],
         "address": first.get("formatted_address", query),
     }
+    _geocode_cache[cache_key] = (time.monotonic(), result)
+    if len(_geocode_cache) > _CACHE_MAX:
+        _geocode_cache.popitem(last=False)
+    return result
 
 
 def build_directions_url(
@@ -1,12 +1,17 @@
 import logging
 
-from telegram.ext import ApplicationBuilder, Defaults
+from telegram.ext import AIORateLimiter, ApplicationBuilder, Defaults
 
+from app import geo_service, nlp_service
 from app.config import TELEGRAM_BOT_TOKEN, TIMEZONE
 from app.scheduler import schedule_daily_report
 from app.telegram_bot import register_handlers
 from app.web_server import start_web_server
 
+# The format uses neither, so skip the thread/process lookups per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     level=logging.INFO,
@@ -23,6 +28,11 @@ async def post_init(application) -> None:
     logger.info("Post-init complete: scheduler + OAuth server configured")
 
 
+async def post_shutdown(application) -> None:
+    await geo_service.close_session()
+    await nlp_service.close_client()
+
+
 def main() -> None:
     defaults = Defaults(tzinfo=TIMEZONE)
 
@@ -30,7 +40,14 @@ def main() -> None:
         ApplicationBuilder()
         .token(TELEGRAM_BOT_TOKEN)
         .defaults(defaults)
+        # Paces all outgoing calls to Telegram's global and per-group flood
+        # limits, and retries RetryAfter instead of failing the send
+        .rate_limiter(AIORateLimiter(max_retries=3))
+        # One chat's slow GPT/calendar turn must not hold up every other
+        # chat; turns within a chat are serialized by nlp_service.chat_lock
+        .concurrent_updates(256)
         .post_init(post_init)
+        .post_shutdown(post_shutdown)
         .build()
     )
 
@@ -1,38 +1,96 @@
+import asyncio
+import functools
 import json
 import logging
-from datetime import datetime
+import re
+import uuid
+from collections import OrderedDict, deque
+from datetime import date, datetime
 
-from openai import AsyncOpenAI, APIError
+import httpx
+from openai import AsyncOpenAI, APIError, DefaultAsyncHttpxClient
 
 from app.config import OPENAI_API_KEY, OPENAI_MODEL, TIMEZONE
-from app.prompts import SYSTEM_PROMPT, TOOLS
+from app.prompts import DATE_PROMPT, SYSTEM_PROMPT, TOOLS
 
 logger = logging.getLogger(__name__)
 
-_client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+# One pooled client for all chats; warm keep-alive connections skip the
+# TCP/TLS handshake on bursty traffic. Closed by close_client() on shutdown.
+# The SDK retries connection errors, 408/409/429 and 5xx itself, with
+# jittered exponential backoff that honours retry-after.
+_client = AsyncOpenAI(
+    api_key=OPENAI_API_KEY,
+    max_retries=3,
+    http_client=DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=200,
+            max_keepalive_connections=50,
+            keepalive_expiry=60,
+        ),
+    ),
+)
+
+
+async def close_client() -> None:
+    await _client.close()
+
+
+# Routing only has to pick a tool and fill its arguments; the followup
+# (e.g. semantic keyword filtering of a listing) benefits from more reasoning.
+ROUTING_REASONING_EFFORT = "low"
+FOLLOWUP_REASONING_EFFORT = "medium"
 
 # ── Chat History ─────────────────────────────────────────────────
 
 MAX_HISTORY = 100  # max messages per chat (FIFO)
-_chat_histories: dict[int, list[dict]] = {}
+MAX_CHATS = 10_000  # chats kept in memory; least recently active evicted first
+KEEP_TOOL_RESULTS = 2  # most recent tool results sent to GPT in full
+# Rough input budget for history sent per request. Characters stand in for
+# tokens (Korean text is about one token per character or two).
+MAX_HISTORY_CHARS = 12_000
+_chat_histories: OrderedDict[int, deque[dict]] = OrderedDict()
+# Most recent tool-result message per chat, for replace_last_tool_result
+_last_tool_result: dict[int, dict] = {}
+
+# ── Event Context (sent after history for number references) ──
+# Stored already formatted: set once per listing, read on every turn.
+_last_event_context: dict[int, str] = {}
+_EVENT_CONTEXT_HEADER = "[최근 조회/변경 결과 - 번호로 참조 가능]"
 
-# ── Event Context (injected into system prompt for number references) ──
-_last_event_context: dict[int, list[dict]] = {}
 
+# Serializes turns per chat so concurrent messages from one chat can't
+# interleave their history writes; different chats still run in parallel.
+# Callers hold it for a whole turn: routing, execution and followup.
+_chat_locks: dict[int, asyncio.Lock] = {}
 
-def _get_history(chat_id: int) -> list[dict]:
-    return _chat_histories.setdefault(chat_id, [])
 
+def chat_lock(chat_id: int) -> asyncio.Lock:
+    lock = _chat_locks.get(chat_id)
+    if lock is None:
+        lock = _chat_locks[chat_id] = asyncio.Lock()
+    return lock
 
-def _trim_history(chat_id: int) -> None:
+
+def _get_history(chat_id: int) -> deque[dict]:
     hist = _chat_histories.get(chat_id)
-    if hist and len(hist) > MAX_HISTORY:
-        _chat_histories[chat_id] = hist[-MAX_HISTORY:]
+    if hist is not None:
+        _chat_histories.move_to_end(chat_id)
+        return hist
+    # maxlen evicts the oldest message on append
+    hist = _chat_histories[chat_id] = deque(maxlen=MAX_HISTORY)
+    if len(_chat_histories) > MAX_CHATS:
+        stale_id, _ = _chat_histories.popitem(last=False)
+        _last_event_context.pop(stale_id, None)
+        _last_tool_result.pop(stale_id, None)
+        lock = _chat_locks.get(stale_id)
+        if lock is not None and not lock.locked():
+            del _chat_locks[stale_id]
+    return hist
 
 
 def add_user_message(chat_id: int, content: str) -> None:
     _get_history(chat_id).append({"role": "user", "content": content})
-    _trim_history(chat_id)
 
 
 def add_assistant_tool_call(chat_id: int, tool_call_raw: dict) -> None:
@@ -41,36 +99,37 @@ def add_assistant_tool_call(chat_id: int, tool_call_raw: dict) -> None:
         "role": "assistant",
         "tool_calls": [tool_call_raw],
     })
-    _trim_history(chat_id)
 
 
 def add_tool_result(chat_id: int, tool_call_id: str, content: str) -> None:
     """Store the tool execution result so GPT can reference it later."""
-    _get_history(chat_id).append({
+    msg = {
         "role": "tool",
         "tool_call_id": tool_call_id,
         "content": content,
-    })
-    _trim_history(chat_id)
+    }
+    _get_history(chat_id).append(msg)
+    _last_tool_result[chat_id] = msg
 
 
 def add_assistant_message(chat_id: int, content: str) -> None:
     _get_history(chat_id).append({"role": "assistant", "content": content})
-    _trim_history(chat_id)
 
 
 def replace_last_tool_result(chat_id: int, new_content: str) -> None:
     """Replace the last tool result in history with filtered content."""
-    hist = _get_history(chat_id)
-    for i in range(len(hist) - 1, -1, -1):
-        if hist[i].get("role") == "tool":
-            hist[i]["content"] = new_content
-            break
+    msg = _last_tool_result.get(chat_id)
+    if msg is not None:
+        msg["content"] = new_content
 
 
 def set_event_context(chat_id: int, events: list[dict]) -> None:
-    """Store structured event context for system prompt injection."""
-    _last_event_context[chat_id] = events
+    """Store structured event context for injection into GPT requests."""
+    block = _format_event_context(events)
+    if block:
+        _last_event_context[chat_id] = block
+    else:
+        _last_event_context.pop(chat_id, None)
 
 
 def clear_event_context(chat_id: int) -> None:
@@ -78,57 +137,191 @@ def clear_event_context(chat_id: int) -> None:
     _last_event_context.pop(chat_id, None)
 
 
-def _format_event_context(chat_id: int) -> str:
-    """Format event context as a compact block for system prompt injection."""
-    events = _last_event_context.get(chat_id)
+def _format_event_context(events: list[dict]) -> str:
+    """Format event context as a compact block for injection into GPT requests."""
     if not events:
         return ""
 
-    lines = ["\n\n[최근 조회/변경 결과 - 번호로 참조 가능]"]
+    lines = [_EVENT_CONTEXT_HEADER]
     for ev in events:
-        idx = ev.get("idx", "?")
-        title = ev.get("title", "(제목 없음)")
-        date = ev.get("date", "")
-        start_time = ev.get("start_time", "종일")
+        time_str = ev.get("start_time", "종일")
         end_time = ev.get("end_time", "")
-        location = ev.get("location", "")
-        description = ev.get("description", "")
-
-        time_str = start_time
         if end_time:
-            time_str += f"~{end_time}"
+            time_str = f"{time_str}~{end_time}"
 
-        parts = [f"{idx}: {title} | {date} | {time_str}"]
-        if location:
-            parts[0] += f" | 📍{location}"
-        if description:
+        location = ev.get("location", "")
+        location_str = f" | 📍{location}" if location else ""
+
+        description = ev.get("description", "")
+        if len(description) > 50:
             # Truncate long descriptions
-            desc_short = description[:50] + "..." if len(description) > 50 else description
-            parts[0] += f" | 💬{desc_short}"
-        lines.append(parts[0])
+            description = f"{description[:50]}..."
+        description_str = f" | 💬{description}" if description else ""
+
+        lines.append(
+            f"{ev.get('idx', '?')}: {ev.get('title', '(제목 없음)')} | "
+            f"{ev.get('date', '')} | {time_str}{location_str}{description_str}"
+        )
 
     return "\n".join(lines)
 
 
+def _message_chars(msg: dict) -> int:
+    size = len(msg.get("content") or "")
+    for call in msg.get("tool_calls", ()):
+        size += len(call["function"]["arguments"])
+    return size
+
+
+def _truncate_tool_content(content: str, limit: int) -> str:
+    """Cut a tool result to about limit chars at a line boundary."""
+    cut = content.rfind("\n", 0, limit)
+    if cut <= 0:
+        cut = max(limit, 0)
+    return f"{content[:cut]}\n…(이하 {len(content) - cut}자 생략)"
+
+
+def _compact_history(hist: deque[dict]) -> list[dict]:
+    """Copy history for a request, shrinking what GPT no longer needs.
+
+    The newest user turn (the message and the tool call/result answering
+    it) is always sent; if it alone exceeds MAX_HISTORY_CHARS its tool
+    results are truncated. Older tool results are cut to their first line,
+    and older messages are dropped once the budget is spent. The stored
+    history is left untouched. Tool messages whose tool_calls message
+    falls outside the window are dropped too, since the API rejects them.
+    """
+    messages = list(hist)
+    turn = 0
+    for i in range(len(messages) - 1, -1, -1):
+        if messages[i]["role"] == "user":
+            turn = i
+            break
+
+    seen = 0
+    total = 0
+    tool_indices = []
+    for i in range(len(messages) - 1, -1, -1):
+        msg = messages[i]
+        if msg["role"] == "tool":
+            seen += 1
+            if seen > KEEP_TOOL_RESULTS:
+                content = msg["content"]
+                first_line = content.split("\n", 1)[0][:40]
+                if first_line != content:
+                    msg = messages[i] = {**msg, "content": f"{first_line} …(이전 결과 생략)"}
+            if i >= turn:
+                tool_indices.append(i)
+
+        size = _message_chars(msg)
+        if i < turn and total + size > MAX_HISTORY_CHARS:
+            start = i + 1
+            break
+        total += size
+    else:
+        start = 0
+
+    # Over budget on the current turn alone: shorten its biggest tool results
+    overflow = total - MAX_HISTORY_CHARS
+    for i in sorted(tool_indices, key=lambda k: -len(messages[k]["content"])):
+        if overflow <= 0:
+            break
+        content = messages[i]["content"]
+        shortened = _truncate_tool_content(content, len(content) - overflow)
+        overflow -= len(content) - len(shortened)
+        messages[i] = {**messages[i], "content": shortened}
+
+    while start < len(messages) and messages[start]["role"] == "tool":
+        start += 1
+    return messages[start:]
+
+
+# ── Fast Intents ─────────────────────────────────────────────────
+
+# Messages that are nothing but a today/this-week query ("오늘 일정",
+# "이번주 뭐 있어?") are routed locally without a GPT round-trip. Anything
+# longer or different (e.g. "오늘 일정 추가 ...") goes to GPT as usual.
+_FAST_TAIL = (
+    r"(?:\s*(?:일정|스케줄))?"
+    r"(?:\s*(?:뭐야|뭐\s*있어|있어|알려\s*줘|보여\s*줘))?"
+    r"\s*[?？!.~]*\s*"
+)
+_FAST_INTENTS = (
+    (re.compile(rf"\s*오늘(?=\s*\S){_FAST_TAIL}"), "get_today_events"),
+    (re.compile(rf"\s*이번\s*주(?=\s*\S){_FAST_TAIL}"), "get_week_events"),
+)
+
+
+def match_fast_intent(user_message: str) -> str | None:
+    for pattern, fn_name in _FAST_INTENTS:
+        if pattern.fullmatch(user_message):
+            return fn_name
+    return None
+
+
 # ── Public API ────────────────────────────────────────────────────
 
+_WEEKDAY_NAMES = ("월요일", "화요일", "수요일", "목요일", "금요일", "토요일", "일요일")
+
+
+@functools.lru_cache(maxsize=1)
+def _date_line(ordinal: int) -> str:
+    """Format DATE_PROMPT for a day; recomputed only when the day changes."""
+    today = date.fromordinal(ordinal)
+    return DATE_PROMPT.format(
+        today=today.isoformat(), weekday=_WEEKDAY_NAMES[today.weekday()]
+    )
+
+
 def _build_messages(chat_id: int) -> list[dict]:
-    today = datetime.now(TIMEZONE)
-    today_str = today.strftime("%Y-%m-%d")
-    weekday_names = ["월요일", "화요일", "수요일", "목요일", "금요일", "토요일", "일요일"]
-    today_weekday = weekday_names[today.weekday()]
-    system = SYSTEM_PROMPT.format(today=today_str, weekday=today_weekday)
-
-    # Inject structured event context into system prompt
-    event_context = _format_event_context(chat_id)
+    date_line = _date_line(datetime.now(TIMEZONE).toordinal())
+
+    messages = [
+        {"role": "developer", "content": SYSTEM_PROMPT},
+        {"role": "developer", "content": date_line},
+        *_compact_history(_get_history(chat_id)),
+    ]
+
+    # The event context changes with every listing, so it goes last:
+    # everything before it stays a cacheable, append-only prefix
+    event_context = _last_event_context.get(chat_id)
     if event_context:
-        system += event_context
+        messages.append({"role": "developer", "content": event_context})
+    return messages
 
-    return [{"role": "developer", "content": system}] + _get_history(chat_id)
+
+def _awaiting_answer(chat_id: int) -> bool:
+    """True if GPT's last turn was a plain text reply, e.g. a clarifying
+    question, so the next message may be an answer rather than a request."""
+    hist = _chat_histories.get(chat_id)
+    if not hist or len(hist) < 2:
+        return False
+    previous, last = hist[-2], hist[-1]
+    return last["role"] == "assistant" and "tool_calls" not in last and previous["role"] == "user"
 
 
 async def process_message(user_message: str, chat_id: int) -> dict:
+    # "오늘 일정" after "어느 날짜 일정을 삭제할까요?" answers the question;
+    # only GPT has the context to route it
+    fn_name = None if _awaiting_answer(chat_id) else match_fast_intent(user_message)
     add_user_message(chat_id, user_message)
+
+    if fn_name:
+        # Record a tool call as GPT would have made it, so the tool
+        # result that follows pairs up in history
+        tool_call_id = f"call_local_{uuid.uuid4().hex}"
+        add_assistant_tool_call(chat_id, {
+            "id": tool_call_id,
+            "type": "function",
+            "function": {"name": fn_name, "arguments": "{}"},
+        })
+        return {
+            "type": "function_call",
+            "function_name": fn_name,
+            "arguments": {},
+            "tool_call_id": tool_call_id,
+        }
+
     messages = _build_messages(chat_id)
 
     try:
@@ -138,7 +331,7 @@ async def process_message(user_message: str, chat_id: int) -> dict:
             tools=TOOLS,
             tool_choice="auto",
             max_completion_tokens=2000,
-            reasoning_effort="medium",
+            reasoning_effort=ROUTING_REASONING_EFFORT,
         )
 
         message = response.choices[0].message
@@ -181,7 +374,7 @@ async def process_message(user_message: str, chat_id: int) -> dict:
 async def get_followup_response(
     chat_id: int,
     filter_instruction: str | None = None,
-    max_tokens: int = 5000,
+    max_tokens: int = 2000,
 ) -> str:
     """Call GPT again after tool result to compose a natural response."""
     messages = _build_messages(chat_id)
@@ -193,9 +386,12 @@ async def get_followup_response(
             model=OPENAI_MODEL,
             messages=messages,
             max_completion_tokens=max_tokens,
-            reasoning_effort="medium",
+            reasoning_effort=FOLLOWUP_REASONING_EFFORT,
         )
-        content = response.choices[0].message.content or "결과를 처리할 수 없습니다."
+        choice = response.choices[0]
+        if choice.finish_reason == "length":
+            logger.warning("Followup hit max_completion_tokens=%d", max_tokens)
+        content = choice.message.content or "결과를 처리할 수 없습니다."
         add_assistant_message(chat_id, content)
         return content
     except Exception:
@@ -1,9 +1,12 @@
 """GPT function schemas and system prompt for calendar assistant.
 
-Edit SYSTEM_PROMPT and TOOLS here to tune GPT behavior
+Edit SYSTEM_PROMPT, DATE_PROMPT and TOOLS here to tune GPT behavior
 without touching the bot logic in nlp_service.py.
 """
 
+# "additionalProperties": False is only kept where arguments are splatted
+# into calendar_service calls (an unexpected key would raise) or silently
+# dropped (edit_event changes); elsewhere it is just billed input tokens.
 TOOLS = [
     {
         "type": "function",
@@ -137,7 +140,6 @@ TOOLS = [
             "parameters": {
                 "type": "object",
                 "properties": {},
-                "additionalProperties": False,
             },
         },
     },
@@ -149,7 +151,6 @@ TOOLS = [
             "parameters": {
                 "type": "object",
                 "properties": {},
-                "additionalProperties": False,
             },
         },
     },
@@ -190,18 +191,17 @@ TOOLS = [
                         "description": "일정 날짜 (YYYY-MM-DD 형식). 이전 대화의 일정을 참조하는 경우 입력",
                     },
                 },
-                "required": [],
-                "additionalProperties": False,
             },
         },
     },
 ]
 
+# SYSTEM_PROMPT is kept free of per-day values so the prompt prefix stays
+# byte-identical across turns and OpenAI's prompt cache can reuse it.
+# The date goes in a separate DATE_PROMPT message after it.
 SYSTEM_PROMPT = """당신은 캘린더 관리 어시스턴트입니다.
 사용자의 한국어 요청을 분석하여 적절한 함수를 호출해주세요.
 
-오늘 날짜: {today} ({weekday})
-
 규칙:
 - 상대적 날짜(내일, 다음주 월요일 등)는 오늘 날짜 기준으로 절대 날짜(YYYY-MM-DD)로 변환하세요.
 - 시간은 24시간 형식(HH:MM)으로 변환하세요. (오후 3시 → 15:00)
@@ -217,3 +217,5 @@ SYSTEM_PROMPT = """당신은 캘린더 관리 어시스턴트입니다.
 - 길찾기 요청은 항상 navigate 함수를 호출하세요. 사용자가 장소명/주소를 직접 말하면 destination 파라미터에 입력하고, 이전 대화의 일정을 참조하면("N번 일정 길찾기", "그 일정 가는 법" 등) 해당 일정의 제목과 날짜를 title/date 파라미터에 입력하세요.
 - 일정 조회 결과에는 제목, 시간, 장소(📍), 설명(💬) 정보가 포함됩니다. 사용자가 장소를 물어보면 이 정보를 활용하세요.
 - 일정에 별도 장소(📍) 정보가 없더라도, 제목이나 설명에 장소명이 포함되어 있으면 그것을 장소로 인식하여 안내하세요. 예: "신규감독관 교육(고용노동교육원)" → 장소는 "고용노동교육원"."""
+
+DATE_PROMPT = "오늘 날짜: {today} ({weekday})"
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from datetime import time
 
@@ -10,6 +11,10 @@ from app.telegram_bot import format_today_events
 
 logger = logging.getLogger(__name__)
 
+# Sends in flight at once. Pacing to Telegram's flood limits and retrying
+# RetryAfter are left to the application's AIORateLimiter.
+_SEND_CONCURRENCY = 20
+
 
 async def daily_report_job(context: ContextTypes.DEFAULT_TYPE) -> None:
     logger.info("Running daily report job")
@@ -27,13 +32,18 @@ async def daily_report_job(context: ContextTypes.DEFAULT_TYPE) -> None:
         logger.info("No authenticated users to send daily report to")
         return
 
-    for chat_id in chat_ids:
-        try:
-            await context.bot.send_message(chat_id=chat_id, text=text)
-        except telegram.error.Forbidden:
-            logger.warning("User %s blocked the bot", chat_id)
-        except Exception:
-            logger.exception("Failed to send daily report to chat_id=%s", chat_id)
+    sem = asyncio.Semaphore(_SEND_CONCURRENCY)
+
+    async def _send(chat_id: int) -> None:
+        async with sem:
+            try:
+                await context.bot.send_message(chat_id=chat_id, text=text)
+            except telegram.error.Forbidden:
+                logger.warning("User %s blocked the bot", chat_id)
+            except Exception:
+                logger.exception("Failed to send daily report to chat_id=%s", chat_id)
+
+    await asyncio.gather(*(_send(chat_id) for chat_id in chat_ids))
 
 
 def schedule_daily_report(application: Application) -> None:
@@ -1,9 +1,16 @@
+import asyncio
 import calendar as cal
+import functools
 import logging
 import re
-from datetime import datetime, timedelta
-
-from telegram import KeyboardButton, ReplyKeyboardMarkup, ReplyKeyboardRemove, Update
+import sys
+import time
+from datetime import date, datetime, timedelta
+from enum import IntEnum
+
+from telegram import Chat, KeyboardButton, ReplyKeyboardMarkup, ReplyKeyboardRemove, Update
+from telegram.constants import ChatAction, MessageLimit
+from telegram.error import TelegramError
 from telegram.ext import (
     Application,
     CommandHandler,
@@ -13,38 +20,62 @@ from telegram.ext import (
 )
 
 from app import calendar_service, geo_service, nlp_service
+from app.config import TIMEZONE
 
 logger = logging.getLogger(__name__)
 
 WEEKDAY_NAMES = ["월", "화", "수", "목", "금", "토", "일"]
+_DIGITS_RE = re.compile(r"\d+")
+
+# During an upstream outage every message fails the same way; log the full
+# traceback once per window per message and a one-liner otherwise
+_TRACEBACK_INTERVAL = 60
+_last_traceback: dict[tuple, float] = {}
+
+
+def _log_error(msg: str, *args, exc_info: BaseException | bool = True) -> None:
+    exc = sys.exc_info()[1] if exc_info is True else exc_info or None
+    # Throttled per message, arguments and exception type, so one failing
+    # function doesn't hide another's traceback
+    key = (msg, args, type(exc))
+    now = time.monotonic()
+    if now - _last_traceback.get(key, -_TRACEBACK_INTERVAL) >= _TRACEBACK_INTERVAL:
+        _last_traceback[key] = now
+        logger.error(msg, *args, exc_info=exc)
+    else:
+        logger.error(msg + " (traceback suppressed): %r", *args, exc)
 
 
 # ── Command Handlers ──────────────────────────────────────────────
 
+_START_AUTHED = (
+    "이미 인증되었습니다!\n"
+    "자연어로 일정을 관리하세요.\n\n"
+    "💡 사용 예시:\n"
+    '• "내일 오후 3시에 팀 회의"\n'
+    '• "오늘 일정 뭐야?"\n'
+    '• "이번 주 일정 알려줘"\n'
+    '• "내일 팀 회의 삭제해줘"\n'
+    '• "팀 회의 시간 4시로 변경해줘"\n'
+    '• "2월 일정 다 지워줘"'
+)
+_START_UNAUTHED = (
+    "안녕하세요! 📅 캘린더 봇입니다.\n\n"
+    "Google 계정을 연동하려면 아래 링크를 열어주세요:\n\n"
+    "{auth_url}\n\n"
+    "권한을 허용하면 자동으로 인증이 완료됩니다!"
+)
+
+
 async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     chat_id = update.effective_chat.id
 
     if calendar_service.is_authenticated(chat_id):
-        await update.message.reply_text(
-            "이미 인증되었습니다!\n"
-            "자연어로 일정을 관리하세요.\n\n"
-            "💡 사용 예시:\n"
-            '• "내일 오후 3시에 팀 회의"\n'
-            '• "오늘 일정 뭐야?"\n'
-            '• "이번 주 일정 알려줘"\n'
-            '• "내일 팀 회의 삭제해줘"\n'
-            '• "팀 회의 시간 4시로 변경해줘"\n'
-            '• "2월 일정 다 지워줘"'
-        )
+        await update.message.reply_text(_START_AUTHED)
         return
 
     auth_url = calendar_service.get_auth_url(chat_id)
-    await update.message.reply_text(
-        "안녕하세요! 📅 캘린더 봇입니다.\n\n"
-        "Google 계정을 연동하려면 아래 링크를 열어주세요:\n\n"
-        f"{auth_url}\n\n"
-        "권한을 허용하면 자동으로 인증이 완료됩니다!"
-    )
+    await update.message.reply_text(_START_UNAUTHED.format(auth_url=auth_url))
 
 
 async def auth_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -83,51 +114,55 @@ async def today_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         events = await calendar_service.get_today_events()
         await update.message.reply_text(format_today_events(events))
     except Exception:
-        logger.exception("Error fetching today's events")
+        _log_error("Error fetching today's events")
         await update.message.reply_text("일정을 불러오는 중 오류가 발생했습니다.")
 
 
 # ── Function Registry ─────────────────────────────────────────────
 
+def _time_range(args: dict) -> str:
+    if args.get("end_time"):
+        return f"{args['start_time']} - {args['end_time']}"
+    return args["start_time"]
+
+
+def _event_extras(args: dict) -> str:
+    """Location/description lines appended to an add confirmation."""
+    extras = ""
+    if args.get("location"):
+        extras += f"\n📍 {args['location']}"
+    if args.get("description"):
+        extras += f"\n💬 {args['description']}"
+    return extras
+
+
 async def _exec_add_event(chat_id: int, args: dict) -> str:
     success, result = await calendar_service.add_event(chat_id=chat_id, **args)
     if success:
-        time_str = args["start_time"]
-        if args.get("end_time"):
-            time_str += f" - {args['end_time']}"
-        reply = f"✅ 일정이 추가되었습니다!\n\n📅 {args['date']}\n🕐 {time_str}\n📝 {args['title']}"
-        if args.get("location"):
-            reply += f"\n📍 {args['location']}"
-        if args.get("description"):
-            reply += f"\n💬 {args['description']}"
-        return reply
+        return (
+            f"✅ 일정이 추가되었습니다!\n\n📅 {args['date']}\n🕐 {_time_range(args)}\n"
+            f"📝 {args['title']}{_event_extras(args)}"
+        )
     return f"❌ 일정 추가 실패\n{result}"
 
 
 async def _exec_add_events_by_range(chat_id: int, args: dict) -> str:
     count, error = await calendar_service.add_events_by_range(chat_id=chat_id, **args)
     if count > 0:
-        time_str = args["start_time"]
-        if args.get("end_time"):
-            time_str += f" - {args['end_time']}"
-        msg = f"✅ {count}개 일정이 추가되었습니다!\n\n📅 {args['date_from']} ~ {args['date_to']}\n🕐 {time_str}\n📝 {args['title']}"
-        if args.get("location"):
-            msg += f"\n📍 {args['location']}"
-        if args.get("description"):
-            msg += f"\n💬 {args['description']}"
-        return msg
+        return (
+            f"✅ {count}개 일정이 추가되었습니다!\n\n📅 {args['date_from']} ~ {args['date_to']}\n"
+            f"🕐 {_time_range(args)}\n📝 {args['title']}{_event_extras(args)}"
+        )
     return f"❌ 일정 추가 실패\n{error}"
 
 
 async def _exec_add_multiday_event(chat_id: int, args: dict) -> str:
     success, result = await calendar_service.add_multiday_event(chat_id=chat_id, **args)
     if success:
-        reply = f"✅ 일정이 추가되었습니다!\n\n📅 {args['date_from']} ~ {args['date_to']}\n📝 {args['title']}"
-        if args.get("location"):
-            reply += f"\n📍 {args['location']}"
-        if args.get("description"):
-            reply += f"\n💬 {args['description']}"
-        return reply
+        return (
+            f"✅ 일정이 추가되었습니다!\n\n📅 {args['date_from']} ~ {args['date_to']}\n"
+            f"📝 {args['title']}{_event_extras(args)}"
+        )
     return f"❌ 일정 추가 실패\n{result}"
 
 
@@ -144,30 +179,31 @@ async def _exec_delete_events_by_range(chat_id: int, args: dict) -> str:
         msg = f"🗑️ {count}개 일정이 삭제되었습니다!\n\n📅 {args['date_from']} ~ {args['date_to']}"
         if args.get("keyword"):
             msg += f'\n🔍 키워드: "{args["keyword"]}"'
+        if error:
+            msg += f"\n⚠️ {error}"
         return msg
     return f"❌ 일정 삭제 실패\n{error}"
 
 
+# edit_event change keys and their labels, in display order
+_EDIT_FIELDS = (
+    ("title", "제목"),
+    ("date", "날짜"),
+    ("start_time", "시작"),
+    ("end_time", "종료"),
+    ("location", "장소"),
+    ("description", "설명"),
+)
+
+
 async def _exec_edit_event(chat_id: int, args: dict) -> str:
     success, result = await calendar_service.edit_event(chat_id=chat_id, **args)
     if success:
         changes = args.get("changes", {})
         reply = f"✏️ 일정이 수정되었습니다!\n\n📝 {result}"
-        details = []
-        if changes.get("title"):
-            details.append(f"제목 → {changes['title']}")
-        if changes.get("date"):
-            details.append(f"날짜 → {changes['date']}")
-        if changes.get("start_time"):
-            details.append(f"시작 → {changes['start_time']}")
-        if changes.get("end_time"):
-            details.append(f"종료 → {changes['end_time']}")
-        if changes.get("location"):
-            details.append(f"장소 → {changes['location']}")
-        if changes.get("description"):
-            details.append(f"설명 → {changes['description']}")
+        details = [f"• {label} → {value}" for key, label in _EDIT_FIELDS if (value := changes.get(key))]
         if details:
-            reply += "\n\n변경사항:\n" + "\n".join(f"• {d}" for d in details)
+            reply += "\n\n변경사항:\n" + "\n".join(details)
         return reply
     return f"❌ 일정 수정 실패\n{result}"
 
@@ -192,34 +228,45 @@ async def _exec_search_events(chat_id: int, args: dict) -> str:
 
 # ── Raw Event Cache ──────────────────────────────────────────────
 
+# Set by the query executors and popped by handle_text_message in the same turn
 _last_raw_events: dict[int, list[dict]] = {}
 
 
+# Listings echoed into history as the assistant's reply are capped: the full
+# list is in the tool result or the event context, and every later turn
+# would otherwise resend it to GPT
+_HISTORY_LISTING_MAX = 2000
+
+
+def _for_history(text: str) -> str:
+    if len(text) <= _HISTORY_LISTING_MAX:
+        return text
+    cut = text.rfind("\n", 0, _HISTORY_LISTING_MAX)
+    if cut <= 0:
+        cut = _HISTORY_LISTING_MAX
+    return f"{text[:cut]}\n…(이하 {len(text) - cut}자 생략)"
+
+
 def _extract_event_context(events: list[dict]) -> list[dict]:
     """Extract structured context from raw Google Calendar events for GPT injection."""
     result = []
     for i, event in enumerate(events, 1):
-        title = event.get("summary", "(제목 없음)")
-        dt_str, time_str = _event_time(event)
+        start = event.get("start", {})
+        end = event.get("end", {})
+        dt_str, time_str = _event_time_from(start, end)
 
         # Extract end time
-        end_time = ""
-        end = event.get("end", {})
-        if "dateTime" in end:
-            end_time = end["dateTime"][11:16]
+        end_time = end["dateTime"][11:16] if "dateTime" in end else ""
 
         # Extract start_time (not the full time_str which may include "종일")
-        start_time = time_str
-        start = event.get("start", {})
-        if "dateTime" in start:
-            start_time = start["dateTime"][11:16]
+        start_time = start["dateTime"][11:16] if "dateTime" in start else time_str
 
         location = _extract_location(event)
         description = event.get("description", "")
 
         result.append({
             "idx": i,
-            "title": title,
+            "title": event.get("summary", "(제목 없음)"),
             "date": dt_str,
             "start_time": start_time,
             "end_time": end_time,
@@ -231,8 +278,39 @@ def _extract_event_context(events: list[dict]) -> list[dict]:
 
 # ── Navigation ───────────────────────────────────────────────────
 
-# Pending navigation: chat_id -> {"destination": str, "lat": float, "lng": float, "address": str}
+# Pending navigation: chat_id -> {"destination": str, "lat": float, "lng": float,
+# "address": str, "expires_at": float}, oldest first
 _pending_navigation: dict[int, dict] = {}
+_PENDING_NAVIGATION_TTL = 600  # seconds to share a location before the request lapses
+
+
+def _set_pending_navigation(chat_id: int, destination: str, geo: dict) -> None:
+    now = time.monotonic()
+    # Requests that were never answered expire; prune them from the front
+    for stale_id in list(_pending_navigation):
+        if _pending_navigation[stale_id]["expires_at"] > now:
+            break
+        del _pending_navigation[stale_id]
+    _pending_navigation.pop(chat_id, None)
+    _pending_navigation[chat_id] = {
+        "destination": destination,
+        "lat": geo["lat"],
+        "lng": geo["lng"],
+        "address": geo["address"],
+        "expires_at": now + _PENDING_NAVIGATION_TTL,
+    }
+
+
+# Telegram objects are immutable once built, so share one of each
+_LOCATION_KEYBOARD = ReplyKeyboardMarkup(
+    [[KeyboardButton("📍 현재 위치 공유", request_location=True)]],
+    resize_keyboard=True,
+    one_time_keyboard=True,
+)
+_REMOVE_KEYBOARD = ReplyKeyboardRemove()
+
+# A "장소: ..." / "장소 : ..." line in an event description, with its newline
+_LOC_RE = re.compile(r"^[^\S\n]*장소 ?:(.*)\n?", re.MULTILINE)
 
 
 def _extract_location(event: dict) -> str:
@@ -242,29 +320,36 @@ def _extract_location(event: dict) -> str:
         return location
     # Parse "장소: ..." from description
     description = event.get("description") or ""
-    for line in description.split("\n"):
-        line = line.strip()
-        if line.startswith("장소:") or line.startswith("장소 :"):
-            return line.split(":", 1)[1].strip()
-    return ""
+    match = _LOC_RE.search(description)
+    return match[1].strip() if match else ""
+
+
+def _split_location_desc(event: dict) -> tuple[str, str]:
+    """Return (location, description without its 장소 lines) in one scan."""
+    description = event.get("description") or ""
+    match = _LOC_RE.search(description)
+    if match is None:
+        return event.get("location") or "", description.strip()
+    location = event.get("location") or match[1].strip()
+    # Nothing before the first match can be a 장소 line
+    start = match.start()
+    remaining = description[:start] + _LOC_RE.sub("", description[start:])
+    return location, remaining.strip()
 
 
 async def _exec_navigate(chat_id: int, args: dict) -> str:
     destination = args.get("destination", "")
     title_filter = args.get("title", "")
     date_str = args.get("date", "")
+    # A failed lookup must not leave an older destination pending
+    _pending_navigation.pop(chat_id, None)
 
     # Case 1: direct destination provided
     if destination:
         result = await geo_service.geocode(destination)
         if result is None:
             return f"'{destination}'의 위치를 찾을 수 없습니다. 더 구체적인 주소나 장소명을 알려주세요."
-        _pending_navigation[chat_id] = {
-            "destination": destination,
-            "lat": result["lat"],
-            "lng": result["lng"],
-            "address": result["address"],
-        }
+        _set_pending_navigation(chat_id, destination, result)
         return f"📍 '{destination}' 위치를 찾았습니다!\n({result['address']})\n\n아래 버튼을 눌러 현재 위치를 공유해주세요."
 
     # Case 2: calendar event reference (title/date provided or fallback to next event)
@@ -276,41 +361,49 @@ async def _exec_navigate(chat_id: int, args: dict) -> str:
         events = await calendar_service.get_today_events()
 
     logger.info("navigate: title_filter=%r, date_str=%r, events_count=%d", title_filter, date_str, len(events))
-    for i, ev in enumerate(events):
-        logger.info("  event[%d]: summary=%r, location=%r, description=%r",
-                     i, ev.get("summary"), ev.get("location"), ev.get("description", "")[:100])
+    if logger.isEnabledFor(logging.DEBUG):
+        for i, ev in enumerate(events):
+            logger.debug("  event[%d]: summary=%r, location=%r, description=%r",
+                         i, ev.get("summary"), ev.get("location"), ev.get("description", "")[:100])
 
     if not events:
         label = date_str if date_str else "오늘"
         return f"{label} 예정된 일정이 없습니다."
 
-    now = datetime.now()
+    # Google returns dateTime as "YYYY-MM-DDTHH:MM:SS+HH:MM"; with the same
+    # offset as now_iso a plain string compare orders them correctly
+    now = datetime.now(TIMEZONE)
+    now_iso = now.isoformat(timespec="seconds")
+    now_offset = now_iso[19:]
+    # If no title filter and searching today, pick the nearest upcoming event
+    upcoming_only = not title_filter and not date_str
+    title_key = title_filter.casefold()
     target = None
+    # Cheapest checks first; location extraction may scan the description
     for event in events:
-        summary = event.get("summary", "")
-        location = _extract_location(event)
-        if not location:
-            continue
-
-        if title_filter and title_filter not in summary:
+        if title_key and title_key not in event.get("summary", "").casefold():
             continue
 
-        # If no title filter and searching today, pick the nearest upcoming event
-        if not title_filter and not date_str:
+        if upcoming_only:
             start = event.get("start", {})
-            if "dateTime" in start:
-                event_time = datetime.fromisoformat(start["dateTime"])
-                if event_time < now:
+            start_dt = start.get("dateTime")
+            if start_dt:
+                if start_dt[19:] == now_offset:
+                    if start_dt < now_iso:
+                        continue
+                elif datetime.fromisoformat(start_dt) < now:
                     continue
-        target = event
-        break
+
+        location = _extract_location(event)
+        if location:
+            target = event
+            break
 
     if target is None:
         if title_filter:
             return f"'{title_filter}' 일정을 찾을 수 없거나 장소 정보가 없습니다."
         return "장소 정보가 있는 다음 일정을 찾을 수 없습니다."
 
-    location = _extract_location(target)
     summary = target.get("summary", "(제목 없음)")
     _, time_str = _event_time(target)
 
@@ -318,12 +411,7 @@ async def _exec_navigate(chat_id: int, args: dict) -> str:
     if result is None:
         return f"'{location}'의 위치를 찾을 수 없습니다."
 
-    _pending_navigation[chat_id] = {
-        "destination": location,
-        "lat": result["lat"],
-        "lng": result["lng"],
-        "address": result["address"],
-    }
+    _set_pending_navigation(chat_id, location, result)
     return (
         f"📅 {summary} ({time_str})\n"
         f"📍 '{location}' 위치를 찾았습니다!\n({result['address']})\n\n"
@@ -331,43 +419,63 @@ async def _exec_navigate(chat_id: int, args: dict) -> str:
     )
 
 
+class FunctionCategory(IntEnum):
+    """How handle_text_message presents an executor's result."""
+    MUTATION = 1
+    QUERY = 2
+    NAVIGATION = 3
+
+
+# fn_name -> (executor, category); one lookup per message
 FUNCTION_REGISTRY = {
-    "add_event": _exec_add_event,
-    "add_events_by_range": _exec_add_events_by_range,
-    "add_multiday_event": _exec_add_multiday_event,
-    "delete_event": _exec_delete_event,
-    "delete_events_by_range": _exec_delete_events_by_range,
-    "edit_event": _exec_edit_event,
-    "get_today_events": _exec_get_today_events,
-    "get_week_events": _exec_get_week_events,
-    "search_events": _exec_search_events,
-    "navigate": _exec_navigate,
+    "add_event": (_exec_add_event, FunctionCategory.MUTATION),
+    "add_events_by_range": (_exec_add_events_by_range, FunctionCategory.MUTATION),
+    "add_multiday_event": (_exec_add_multiday_event, FunctionCategory.MUTATION),
+    "delete_event": (_exec_delete_event, FunctionCategory.MUTATION),
+    "delete_events_by_range": (_exec_delete_events_by_range, FunctionCategory.MUTATION),
+    "edit_event": (_exec_edit_event, FunctionCategory.MUTATION),
+    "get_today_events": (_exec_get_today_events, FunctionCategory.QUERY),
+    "get_week_events": (_exec_get_week_events, FunctionCategory.QUERY),
+    "search_events": (_exec_search_events, FunctionCategory.QUERY),
+    "navigate": (_exec_navigate, FunctionCategory.NAVIGATION),
+}
+
+
+# Argument holding the affected date, for mutations that don't use "date"
+_MONTH_DATE_FIELD = {
+    "delete_events_by_range": "date_from",
+    "add_events_by_range": "date_from",
+    "add_multiday_event": "date_from",
 }
 
-_MUTATION_FUNCTIONS = {"add_event", "add_events_by_range", "add_multiday_event", "delete_event", "delete_events_by_range", "edit_event"}
-_QUERY_FUNCTIONS = {"get_today_events", "get_week_events", "search_events"}
-_NAVIGATION_FUNCTIONS = {"navigate"}
+
+# Busy months would overflow a Telegram message anyway
+_MONTH_SUMMARY_MAX = 50
+
+
+@functools.lru_cache(maxsize=256)
+def _month_last_day(year: int, month: int) -> int:
+    return cal.monthrange(year, month)[1]
 
 
 def _extract_month_range(fn_name: str, args: dict) -> tuple[str, str] | None:
     """Return (YYYY-MM-DD, YYYY-MM-DD) for the month affected by a mutation."""
-    if fn_name in ("delete_events_by_range", "add_events_by_range", "add_multiday_event"):
-        date_str = args.get("date_from", "")
-    elif fn_name == "edit_event":
+    if fn_name == "edit_event":
         # If the date was changed, show the new month
         date_str = args.get("changes", {}).get("date") or args.get("date", "")
     else:
-        date_str = args.get("date", "")
+        date_str = args.get(_MONTH_DATE_FIELD.get(fn_name, "date"), "")
 
     if not date_str or len(date_str) < 7:
         return None
 
     try:
         year, month = int(date_str[:4]), int(date_str[5:7])
-        last_day = cal.monthrange(year, month)[1]
-        return f"{year}-{month:02d}-01", f"{year}-{month:02d}-{last_day:02d}"
-    except (ValueError, IndexError):
+        last_day = _month_last_day(year, month)
+    except ValueError:
         return None
+    year_month = date_str[:7]
+    return f"{year_month}-01", f"{year_month}-{last_day:02d}"
 
 
 async def _get_month_summary(chat_id: int, fn_name: str, args: dict) -> tuple[str | None, list[dict]]:
@@ -380,10 +488,12 @@ async def _get_month_summary(chat_id: int, fn_name: str, args: dict) -> tuple[st
     date_from, date_to = month_range
     try:
         events = await calendar_service.search_events(
-            chat_id=chat_id, date_from=date_from, date_to=date_to
+            chat_id=chat_id, date_from=date_from, date_to=date_to,
+            # One extra tells a full month from one that was cut off
+            max_results=_MONTH_SUMMARY_MAX + 1,
         )
     except Exception:
-        logger.exception("Error fetching month summary")
+        _log_error("Error fetching month summary")
         return None, []
 
     month_label = f"{date_from[:4]}년 {int(date_from[5:7])}월"
@@ -391,23 +501,19 @@ async def _get_month_summary(chat_id: int, fn_name: str, args: dict) -> tuple[st
     if not events:
         return f"\n📋 {month_label} 전체 일정: 없음", []
 
-    lines = [f"\n📋 {month_label} 전체 일정 ({len(events)}건):"]
+    if len(events) > _MONTH_SUMMARY_MAX:
+        events = events[:_MONTH_SUMMARY_MAX]
+        count_label = f"{_MONTH_SUMMARY_MAX}건 초과, 앞 {_MONTH_SUMMARY_MAX}건만 표시"
+    else:
+        count_label = f"{len(events)}건"
+    lines = [f"\n📋 {month_label} 전체 일정 ({count_label}):"]
     current_date = ""
-    for idx, event in enumerate(events, 1):
-        summary = event.get("summary", "(제목 없음)")
-        dt_str, time_str = _event_time(event)
-
+    for idx, dt_str, time_str, summary, detail in _event_rows(events):
         if dt_str != current_date:
             current_date = dt_str
-            try:
-                dt = datetime.strptime(dt_str, "%Y-%m-%d")
-                weekday = WEEKDAY_NAMES[dt.weekday()]
-                lines.append(f"\n  📆 {dt_str} ({weekday})")
-            except ValueError:
-                lines.append(f"\n  📆 {dt_str}")
+            lines.append(f"\n  {_date_header(dt_str)}")
 
         lines.append(f"    {idx}. 🕐 {time_str} - {summary}")
-        detail = _event_detail(event)
         if detail:
             lines.append(f"      {detail}")
 
@@ -416,6 +522,44 @@ async def _get_month_summary(chat_id: int, fn_name: str, args: dict) -> tuple[st
 
 # ── Natural Language Message Handler ──────────────────────────────
 
+def _text_length(text: str) -> int:
+    """Length as Telegram counts it (UTF-16 code units, so emoji count twice)."""
+    return len(text.encode("utf-16-le")) // 2
+
+
+# Messages that will almost certainly become get_today_events/get_week_events
+# calls. Their listing is fetched while GPT is still routing the message, so
+# the executor finds it in calendar_service's list cache.
+_PREFETCH_TODAY_RE = re.compile(r"오늘.*(일정|스케줄|약속|뭐)")
+_PREFETCH_WEEK_RE = re.compile(r"이번\s*주.*(일정|스케줄|약속|뭐)")
+
+# Strong references so fire-and-forget tasks aren't garbage-collected
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _spawn(coro) -> None:
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+def _prefetch_events(user_message: str) -> None:
+    if nlp_service.match_fast_intent(user_message):
+        return  # routed locally; the executor runs right away
+    if _PREFETCH_TODAY_RE.search(user_message):
+        _spawn(calendar_service.get_today_events())
+    elif _PREFETCH_WEEK_RE.search(user_message):
+        _spawn(calendar_service.get_week_events())
+
+
+async def _send_typing(chat: Chat) -> None:
+    try:
+        await chat.send_action(ChatAction.TYPING)
+    except TelegramError:
+        # Cosmetic only; never let it fail the message
+        logger.debug("Failed to send typing action", exc_info=True)
+
+
 async def handle_text_message(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     chat_id = update.effective_chat.id
     user_message = update.message.text
@@ -424,7 +568,18 @@ async def handle_text_message(update: Update, context: ContextTypes.DEFAULT_TYPE
         await update.message.reply_text("먼저 /start 로 인증을 완료해주세요.")
         return
 
-    result = await nlp_service.process_message(user_message, chat_id)
+    _prefetch_events(user_message)
+    # One turn at a time per chat: a second message waits until the first
+    # one's mutation, reply and history writes are done
+    async with nlp_service.chat_lock(chat_id):
+        await _handle_turn(update, chat_id, user_message)
+
+
+async def _handle_turn(update: Update, chat_id: int, user_message: str) -> None:
+    _, result = await asyncio.gather(
+        _send_typing(update.effective_chat),
+        nlp_service.process_message(user_message, chat_id),
+    )
 
     if result["type"] == "text_response":
         await update.message.reply_text(result["content"])
@@ -439,11 +594,12 @@ async def handle_text_message(update: Update, context: ContextTypes.DEFAULT_TYPE
     args = result["arguments"]
     tool_call_id = result.get("tool_call_id")
 
-    executor = FUNCTION_REGISTRY.get(fn_name)
-    if not executor:
+    entry = FUNCTION_REGISTRY.get(fn_name)
+    if entry is None:
         logger.warning("Unknown function: %s", fn_name)
         await update.message.reply_text("지원하지 않는 기능입니다.")
         return
+    executor, category = entry
 
     try:
         reply = await executor(chat_id, args)
@@ -451,40 +607,52 @@ async def handle_text_message(update: Update, context: ContextTypes.DEFAULT_TYPE
         if tool_call_id:
             nlp_service.add_tool_result(chat_id, tool_call_id, reply)
 
-        if fn_name in _NAVIGATION_FUNCTIONS and chat_id in _pending_navigation:
-            keyboard = ReplyKeyboardMarkup(
-                [[KeyboardButton("📍 현재 위치 공유", request_location=True)]],
-                resize_keyboard=True,
-                one_time_keyboard=True,
-            )
-            sent = await update.message.reply_text(reply, reply_markup=keyboard)
-            _pending_navigation[chat_id]["prompt_message_id"] = sent.message_id
-        elif fn_name in _QUERY_FUNCTIONS:
+        pending = _pending_navigation.get(chat_id) if category == FunctionCategory.NAVIGATION else None
+        if pending is not None:
+            sent = await update.message.reply_text(reply, reply_markup=_LOCATION_KEYBOARD)
+            # Write through our own reference: handle_location may have
+            # popped the entry while the reply was being sent
+            pending["prompt_message_id"] = sent.message_id
+        elif category == FunctionCategory.QUERY:
             has_keyword = fn_name == "search_events" and args.get("keyword")
             raw_events = _last_raw_events.pop(chat_id, [])
 
             if has_keyword and raw_events:
-                # Index-based filtering: ask GPT for matching indices only
                 keyword = args["keyword"]
-                filter_instruction = (
-                    f'위 {len(raw_events)}개 일정 목록에서 "{keyword}"와 관련된 '
-                    f'일정의 번호만 쉼표로 답변하세요. 예: "1,3,5". 없으면 "없음". '
-                    f'제목이나 설명에 "{keyword}"가 포함된 일정은 반드시 포함하세요. '
-                    f'의미적으로 동일한 주제인 일정도 포함하되, '
-                    f'단순히 비슷한 글자가 들어간 일정(예: 노사누리≠노동부, 노사누리≠노무사회)은 제외하세요.'
-                )
-                gpt_indices = await nlp_service.get_followup_response(
-                    chat_id, filter_instruction, max_tokens=2000
-                )
-
-                # Parse indices from GPT response (e.g. "1,3,5" or "없음")
-                filtered_events = []
-                if "없음" not in gpt_indices:
-                    idx_matches = re.findall(r'\d+', gpt_indices)
-                    for idx_str in idx_matches:
-                        idx = int(idx_str) - 1  # 1-based → 0-based
-                        if 0 <= idx < len(raw_events):
-                            filtered_events.append(raw_events[idx])
+                # Literal title/description hits (case-insensitive, like
+                # navigation's title filter) answer most searches without
+                # another GPT round-trip. Trade-off: when there is any literal
+                # hit, semantically related events without the keyword are
+                # not added.
+                keyword_key = keyword.casefold()
+                filtered_events = [
+                    e for e in raw_events
+                    if keyword_key in e.get("summary", "").casefold()
+                    or keyword_key in e.get("description", "").casefold()
+                ]
+
+                if not filtered_events:
+                    # Index-based filtering: ask GPT for matching indices only.
+                    # The old "literal hits must be included" rule is gone:
+                    # GPT is only asked when there are none.
+                    filter_instruction = (
+                        f'위 {len(raw_events)}개 일정 목록에서 "{keyword}"와 관련된 '
+                        f'일정의 번호만 쉼표로 답변하세요. 예: "1,3,5". 없으면 "없음". '
+                        f'의미적으로 동일한 주제인 일정은 포함하되, '
+                        f'단순히 비슷한 글자가 들어간 일정(예: 노사누리≠노동부, 노사누리≠노무사회)은 제외하세요.'
+                    )
+                    gpt_indices = await nlp_service.get_followup_response(
+                        chat_id, filter_instruction, max_tokens=2000
+                    )
+
+                    # Parse indices from GPT response (e.g. "1,3,5" or "없음")
+                    if "없음" not in gpt_indices:
+                        count = len(raw_events)
+                        filtered_events = [
+                            raw_events[i - 1]  # 1-based
+                            for i in map(int, _DIGITS_RE.findall(gpt_indices))
+                            if 1 <= i <= count
+                        ]
 
                 # Format the filtered results with our formatter
                 filtered_reply = format_search_results(filtered_events, keyword)
@@ -501,25 +669,33 @@ async def handle_text_message(update: Update, context: ContextTypes.DEFAULT_TYPE
             else:
                 # Full listing — send formatted text directly
                 await update.message.reply_text(reply)
-                nlp_service.add_assistant_message(chat_id, reply)
+                nlp_service.add_assistant_message(chat_id, _for_history(reply))
 
                 # Set structured event context for number references
                 nlp_service.set_event_context(
                     chat_id, _extract_event_context(raw_events)
                 )
+        elif category == FunctionCategory.MUTATION:
+            # After mutation, show the affected month's events — in the same
+            # message when it fits, to halve sends against the flood limit
+            month_summary, month_events = await _get_month_summary(chat_id, fn_name, args)
+            if not month_summary:
+                await update.message.reply_text(reply)
+            else:
+                combined = f"{reply}\n{month_summary}"
+                if _text_length(combined) <= MessageLimit.MAX_TEXT_LENGTH:
+                    await update.message.reply_text(combined)
+                else:
+                    await update.message.reply_text(reply)
+                    await update.message.reply_text(month_summary)
+                nlp_service.add_assistant_message(chat_id, _for_history(month_summary))
+                # Set structured context from month events for number references
+                nlp_service.set_event_context(chat_id, _extract_event_context(month_events))
         else:
             await update.message.reply_text(reply)
-
-            # After mutation, show the affected month's events
-            if fn_name in _MUTATION_FUNCTIONS:
-                month_summary, month_events = await _get_month_summary(chat_id, fn_name, args)
-                if month_summary:
-                    await update.message.reply_text(month_summary)
-                    nlp_service.add_assistant_message(chat_id, month_summary)
-                    # Set structured context from month events for number references
-                    nlp_service.set_event_context(chat_id, _extract_event_context(month_events))
     except Exception:
-        logger.exception("Error executing %s", fn_name)
+        _log_error("Error executing %s", fn_name)
+        _last_raw_events.pop(chat_id, None)
         if tool_call_id:
             nlp_service.add_tool_result(chat_id, tool_call_id, "처리 중 오류가 발생했습니다.")
         await update.message.reply_text("처리 중 오류가 발생했습니다.")
@@ -531,10 +707,10 @@ async def handle_location(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     location = update.message.location
 
     pending = _pending_navigation.pop(chat_id, None)
-    if pending is None:
+    if pending is None or pending["expires_at"] < time.monotonic():
         await update.message.reply_text(
             "길찾기 요청이 없습니다. 먼저 목적지를 알려주세요.",
-            reply_markup=ReplyKeyboardRemove(),
+            reply_markup=_REMOVE_KEYBOARD,
         )
         return
 
@@ -563,24 +739,38 @@ async def handle_location(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             f"📍 도착: {pending['address']}\n\n"
             f"👉 {url}"
         ),
-        reply_markup=ReplyKeyboardRemove(),
+        reply_markup=_REMOVE_KEYBOARD,
     )
 
 
 # ── Formatters ────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=512)
+def _date_header(dt_str: str) -> str:
+    """Day heading for grouped listings, e.g. "📆 2025-03-01 (토)"."""
+    try:
+        return f"📆 {dt_str} ({WEEKDAY_NAMES[date.fromisoformat(dt_str).weekday()]})"
+    except ValueError:
+        return f"📆 {dt_str}"
+
+
 def _event_time(event: dict) -> tuple[str, str]:
     """Return (date_str, time_str) for any event type."""
-    start = event.get("start", {})
-    if "dateTime" in start:
-        return start["dateTime"][:10], start["dateTime"][11:16]
+    return _event_time_from(event.get("start", {}), event.get("end", {}))
+
+
+def _event_time_from(start: dict, end: dict) -> tuple[str, str]:
+    """_event_time for callers that already hold the start/end dicts."""
+    start_dt = start.get("dateTime")
+    if start_dt:
+        return start_dt[:10], start_dt[11:16]
     # All-day event
     start_date = start.get("date", "")
-    end_date = event.get("end", {}).get("date", "")
+    end_date = end.get("date", "")
     if start_date and end_date:
         try:
-            s = datetime.strptime(start_date, "%Y-%m-%d")
-            e = datetime.strptime(end_date, "%Y-%m-%d")
+            s = date.fromisoformat(start_date)
+            e = date.fromisoformat(end_date)
             if (e - s).days > 1:
                 actual_end = (e - timedelta(days=1)).strftime("%m-%d")
                 return start_date, f"{start_date[5:]}~{actual_end} 종일"
@@ -592,32 +782,31 @@ def _event_time(event: dict) -> tuple[str, str]:
 def _event_detail(event: dict) -> str:
     """Return location and description suffix for an event."""
     parts = []
-    location = _extract_location(event)
-    description = event.get("description", "")
+    # The description comes back without 장소 lines, already shown as 📍
+    location, remaining = _split_location_desc(event)
     if location:
         parts.append(f"📍 {location}")
-    if description:
-        # Don't repeat location line already shown as 📍
-        desc_lines = [
-            ln for ln in description.split("\n")
-            if not ln.strip().startswith("장소:") and not ln.strip().startswith("장소 :")
-        ]
-        remaining = "\n".join(desc_lines).strip()
-        if remaining:
-            parts.append(f"💬 {remaining}")
+    if remaining:
+        parts.append(f"💬 {remaining}")
     return "\n    ".join(parts)
 
 
+def _event_rows(events: list[dict]) -> list[tuple[int, str, str, str, str]]:
+    """Flatten events to (idx, date_str, time_str, summary, detail) rows, 1-based."""
+    rows = []
+    for idx, event in enumerate(events, 1):
+        dt_str, time_str = _event_time(event)
+        rows.append((idx, dt_str, time_str, event.get("summary", "(제목 없음)"), _event_detail(event)))
+    return rows
+
+
 def format_today_events(events: list[dict]) -> str:
     if not events:
         return "📭 오늘은 예정된 일정이 없습니다."
 
     lines = ["📅 오늘의 일정:\n"]
-    for i, event in enumerate(events, 1):
-        summary = event.get("summary", "(제목 없음)")
-        _, time_str = _event_time(event)
+    for i, _, time_str, summary, detail in _event_rows(events):
         lines.append(f"{i}. 🕐 {time_str} - {summary}")
-        detail = _event_detail(event)
         if detail:
             lines.append(f"    {detail}")
 
@@ -630,21 +819,12 @@ def format_week_events(events: list[dict]) -> str:
 
     lines = ["📅 이번 주 일정:\n"]
     current_date = ""
-    for idx, event in enumerate(events, 1):
-        summary = event.get("summary", "(제목 없음)")
-        dt_str, time_str = _event_time(event)
-
+    for idx, dt_str, time_str, summary, detail in _event_rows(events):
         if dt_str != current_date:
             current_date = dt_str
-            try:
-                dt = datetime.strptime(dt_str, "%Y-%m-%d")
-                weekday = WEEKDAY_NAMES[dt.weekday()]
-                lines.append(f"\n📆 {dt_str} ({weekday})")
-            except ValueError:
-                lines.append(f"\n📆 {dt_str}")
+            lines.append(f"\n{_date_header(dt_str)}")
 
         lines.append(f"  {idx}. 🕐 {time_str} - {summary}")
-        detail = _event_detail(event)
         if detail:
             lines.append(f"      {detail}")
 
@@ -664,11 +844,8 @@ def format_search_results(events: list[dict], keyword: str | None = None) -> str
     header += f" ({len(events)}건):\n"
 
     lines = [header]
-    for i, event in enumerate(events, 1):
-        summary = event.get("summary", "(제목 없음)")
-        date_str, time_str = _event_time(event)
+    for i, date_str, time_str, summary, detail in _event_rows(events):
         lines.append(f"{i}. 📅 {date_str} 🕐 {time_str} - {summary}")
-        detail = _event_detail(event)
         if detail:
             lines.append(f"    {detail}")
 
@@ -677,17 +854,37 @@ def format_search_results(events: list[dict], keyword: str | None = None) -> str
 
 # ── Error & Registration ─────────────────────────────────────────
 
+_ERROR_REPLY_INTERVAL = 5  # seconds
+# chat_id -> when the last error reply was sent, oldest first
+_last_error_reply: dict[int, float] = {}
+
+
 async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE) -> None:
-    logger.error("Exception while handling update:", exc_info=context.error)
+    _log_error("Exception while handling update:", exc_info=context.error)
 
-    if isinstance(update, Update) and update.effective_chat:
-        try:
-            await context.bot.send_message(
-                chat_id=update.effective_chat.id,
-                text="오류가 발생했습니다. 잠시 후 다시 시도해주세요.",
-            )
-        except Exception:
-            pass
+    if not isinstance(update, Update) or update.effective_chat is None:
+        return
+    # One apology per chat per interval; the rest of a burst would fail too
+    chat_id = update.effective_chat.id
+    now = time.monotonic()
+    if now - _last_error_reply.get(chat_id, -_ERROR_REPLY_INTERVAL) < _ERROR_REPLY_INTERVAL:
+        return
+    # Entries past the interval no longer throttle anything; prune from the front
+    while _last_error_reply:
+        stale_id, sent_at = next(iter(_last_error_reply.items()))
+        if now - sent_at < _ERROR_REPLY_INTERVAL:
+            break
+        del _last_error_reply[stale_id]
+    _last_error_reply.pop(chat_id, None)
+    _last_error_reply[chat_id] = now
+
+    try:
+        await context.bot.send_message(
+            chat_id=chat_id,
+            text="오류가 발생했습니다. 잠시 후 다시 시도해주세요.",
+        )
+    except Exception:
+        pass
 
 
 def register_handlers(application: Application) -> None:
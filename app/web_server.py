@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 from aiohttp import web
@@ -8,6 +9,8 @@ from app.config import OAUTH_SERVER_PORT
 logger = logging.getLogger(__name__)
 
 _bot_app = None  # telegram Application reference
+# Telegram notifications in flight; held so they aren't garbage-collected
+_notify_tasks: set[asyncio.Task] = set()
 
 SUCCESS_HTML = """<!DOCTYPE html>
 <html><head><meta charset="utf-8"><title>인증 완료</title>
@@ -35,55 +38,65 @@ p{color:#c00;font-size:18px;margin-top:16px}
 <body><div class="card"><h1>&#x274C;</h1>
 <p>%s</p></div></body></html>"""
 
+# Encoded once; only the error message is encoded per request
+_SUCCESS_BODY = SUCCESS_HTML.encode()
+_ERROR_PREFIX, _ERROR_SUFFIX = (part.encode() for part in ERROR_HTML.split("%s"))
+
+
+# The result page is per-login; browsers and proxies must not keep it
+_NO_STORE = {"Cache-Control": "no-store"}
+
+
+def _html_response(body: bytes) -> web.Response:
+    return web.Response(
+        body=body, content_type="text/html", charset="utf-8", headers=_NO_STORE
+    )
+
+
+def _error_response(message: str) -> web.Response:
+    return _html_response(b"".join((_ERROR_PREFIX, message.encode(), _ERROR_SUFFIX)))
+
+
+async def _notify(chat_id: int, text: str) -> None:
+    try:
+        await _bot_app.bot.send_message(chat_id=chat_id, text=text)
+    except Exception:
+        logger.exception("Failed to send auth result to chat_id=%s", chat_id)
+
 
 async def oauth_callback(request: web.Request) -> web.Response:
     code = request.query.get("code")
     state = request.query.get("state")  # chat_id
 
     if not code or not state:
-        return web.Response(
-            text=ERROR_HTML % "인증 코드 또는 상태 정보가 없습니다.<br>다시 시도해주세요.",
-            content_type="text/html",
-        )
+        return _error_response("인증 코드 또는 상태 정보가 없습니다.<br>다시 시도해주세요.")
 
     try:
         chat_id = int(state)
     except ValueError:
-        return web.Response(
-            text=ERROR_HTML % "잘못된 인증 요청입니다.",
-            content_type="text/html",
-        )
+        return _error_response("잘못된 인증 요청입니다.")
 
     # Exchange code and authenticate
     success, message = await calendar_service.authenticate_user(chat_id, code)
 
-    # Send result to Telegram
+    # Send result to Telegram without holding up the browser's page
     if _bot_app is not None:
-        try:
-            if success:
-                await _bot_app.bot.send_message(
-                    chat_id=chat_id,
-                    text=(
-                        f"✅ 인증 성공!\n{message}\n\n"
-                        "이제 자연어로 일정을 관리할 수 있습니다.\n"
-                        '예: "내일 오후 3시에 팀 회의"'
-                    ),
-                )
-            else:
-                await _bot_app.bot.send_message(
-                    chat_id=chat_id,
-                    text=f"❌ 인증 실패\n{message}",
-                )
-        except Exception:
-            logger.exception("Failed to send auth result to chat_id=%s", chat_id)
+        if success:
+            text = (
+                f"✅ 인증 성공!\n{message}\n\n"
+                "이제 자연어로 일정을 관리할 수 있습니다.\n"
+                '예: "내일 오후 3시에 팀 회의"'
+            )
+        else:
+            text = f"❌ 인증 실패\n{message}"
+        task = asyncio.create_task(_notify(chat_id, text))
+        _notify_tasks.add(task)
+        task.add_done_callback(_notify_tasks.discard)
 
     if success:
-        return web.Response(text=SUCCESS_HTML, content_type="text/html")
+        return _html_response(_SUCCESS_BODY)
     else:
-        return web.Response(
-            text=ERROR_HTML % f"인증에 실패했습니다.<br>{message}",
-            content_type="text/html",
-        )
+        return _error_response(f"인증에 실패했습니다.<br>{message}")
 
 
 async def start_web_server(application) -> None:
@@ -94,8 +107,10 @@ async def start_web_server(application) -> None:
     app = web.Application()
     app.router.add_get("/oauth/callback", oauth_callback)
 
-    runner = web.AppRunner(app)
+    # No per-request access log line for a single callback route; a deeper backlog
+    # absorbs bursts of users finishing OAuth at the same time.
+    runner = web.AppRunner(app, access_log=None)
     await runner.setup()
-    site = web.TCPSite(runner, "0.0.0.0", OAUTH_SERVER_PORT)
+    site = web.TCPSite(runner, "0.0.0.0", OAUTH_SERVER_PORT, backlog=1024)
     await site.start()
     logger.info("OAuth callback server started on port %s", OAUTH_SERVER_PORT)
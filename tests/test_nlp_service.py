@@ -0,0 +1,109 @@
+import asyncio
+import os
+import unittest
+from collections import deque
+
+# app.config reads these at import time
+for _name in (
+    "TELEGRAM_BOT_TOKEN",
+    "OPENAI_API_KEY",
+    "GOOGLE_CLIENT_ID",
+    "GOOGLE_CLIENT_SECRET",
+    "SHARED_CALENDAR_ID",
+):
+    os.environ.setdefault(_name, "test")
+
+from app import nlp_service  # noqa: E402
+
+
+def _tool_call(call_id: str) -> dict:
+    return {
+        "role": "assistant",
+        "tool_calls": [{
+            "id": call_id,
+            "type": "function",
+            "function": {"name": "search_events", "arguments": '{"keyword": "회의"}'},
+        }],
+    }
+
+
+def _listing(count: int) -> str:
+    return "\n".join(f"{i}. 📅 2025-03-01 🕐 10:00 - 팀 회의 {i}" for i in range(1, count + 1))
+
+
+class CompactHistoryTest(unittest.TestCase):
+    def test_oversized_current_turn_is_kept_and_truncated(self):
+        listing = _listing(600)
+        self.assertGreater(len(listing), nlp_service.MAX_HISTORY_CHARS)
+        hist = deque([
+            {"role": "user", "content": "지난 일정"},
+            {"role": "assistant", "content": "네"},
+            {"role": "user", "content": "회의 검색"},
+            _tool_call("call_1"),
+            {"role": "tool", "tool_call_id": "call_1", "content": listing},
+        ])
+
+        messages = nlp_service._compact_history(hist)
+
+        self.assertEqual([m["role"] for m in messages], ["user", "assistant", "tool"])
+        self.assertEqual(messages[0]["content"], "회의 검색")
+        self.assertEqual(messages[2]["tool_call_id"], "call_1")
+        tool_content = messages[2]["content"]
+        self.assertTrue(tool_content.startswith("1. 📅 2025-03-01"))
+        self.assertIn("생략", tool_content)
+        self.assertLess(len(tool_content), len(listing))
+        total = sum(nlp_service._message_chars(m) for m in messages)
+        self.assertLessEqual(total, nlp_service.MAX_HISTORY_CHARS + 40)
+        # The stored history is untouched
+        self.assertEqual(hist[4]["content"], listing)
+
+    def test_older_messages_fit_the_budget(self):
+        hist = deque()
+        for n in range(4):
+            hist.append({"role": "user", "content": f"질문 {n}"})
+            hist.append(_tool_call(f"call_{n}"))
+            hist.append({"role": "tool", "tool_call_id": f"call_{n}", "content": _listing(5)})
+
+        messages = nlp_service._compact_history(hist)
+
+        self.assertEqual(len(messages), len(hist))
+        tools = [m["content"] for m in messages if m["role"] == "tool"]
+        # Only the newest KEEP_TOOL_RESULTS results are sent in full
+        self.assertTrue(all("이전 결과 생략" in c for c in tools[:-nlp_service.KEEP_TOOL_RESULTS]))
+        self.assertTrue(all(c == _listing(5) for c in tools[-nlp_service.KEEP_TOOL_RESULTS:]))
+
+    def test_build_messages_keeps_search_turn(self):
+        chat_id = -1
+        nlp_service.add_user_message(chat_id, "회의 검색")
+        nlp_service.add_assistant_tool_call(chat_id, _tool_call("call_x")["tool_calls"][0])
+        nlp_service.add_tool_result(chat_id, "call_x", _listing(600))
+
+        roles = [m["role"] for m in nlp_service._build_messages(chat_id)]
+
+        self.assertEqual(roles, ["developer", "developer", "user", "assistant", "tool"])
+
+
+
+class FastIntentTest(unittest.TestCase):
+    def test_fast_path_routes_locally(self):
+        chat_id = -2
+        result = asyncio.run(nlp_service.process_message("오늘 일정", chat_id))
+
+        self.assertEqual(result["type"], "function_call")
+        self.assertTrue(result["tool_call_id"].startswith("call_local_"))
+
+    def test_answer_to_clarifying_question_goes_to_gpt(self):
+        chat_id = -3
+        nlp_service.add_user_message(chat_id, "일정 삭제해줘")
+        nlp_service.add_assistant_message(chat_id, "어느 날짜 일정을 삭제할까요?")
+        self.assertTrue(nlp_service._awaiting_answer(chat_id))
+
+        # A text reply that follows a tool result is not a question
+        nlp_service.add_user_message(chat_id, "회의 검색")
+        nlp_service.add_assistant_tool_call(chat_id, _tool_call("call_y")["tool_calls"][0])
+        nlp_service.add_tool_result(chat_id, "call_y", _listing(2))
+        nlp_service.add_assistant_message(chat_id, "회의가 2개 있습니다.")
+        self.assertFalse(nlp_service._awaiting_answer(chat_id))
+
+if __name__ == "__main__":
+    unittest.main()